@@ -6,64 +6,147 @@ WebRTC CPU使用情况分析器
 """
 
 import re
+import os
 import json
+import mmap
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from pathlib import Path
 from collections import defaultdict, Counter
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# perf report热点行: Children Self Command Shared-Object Symbol
+_HOTSPOT_RE = re.compile(r'\s*(\d+\.\d+)%\s+(\d+\.\d+)%\s+(\w+)\s+([^\s]+)\s+(.+)')
+_SAMPLING_DURATION_RE = re.compile(r'采集时长: (\d+)秒')
+_TARGET_PROCESSES_RE = re.compile(r'目标进程: ([\d\s]+)')
+_SAMPLE_COUNT_RE = re.compile(r'Samples: (\d+[KM]?)')
+_EVENT_COUNT_RE = re.compile(r'Event count \(approx\.\): (\d+)')
+
+# 图表中柱状/饼图路径简单，允许Agg后端最大程度地简化路径
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+
+# 饼图配色按分类数预先取好（最多8个分类），与按需 Set3(linspace(0, 1, n)) 的取色一致
+_CATEGORY_COLORS = {n: plt.cm.Set3(np.linspace(0, 1, n)) for n in range(1, 9)}
+
+_INFO_SCAN_LINES = 200  # 基本信息只在报告前若干行中查找
+_MAX_HOTSPOTS = 20
+
+def _dump_json(obj, path):
+    """写出缩进2格的UTF-8 JSON文件，安装了orjson时直接序列化为字节"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
 class WebRTCCPUAnalyzer:
     def __init__(self, data_dir="webrtc_config_results"):
         self.data_dir = Path(data_dir)
         self.cpu_data = {}
         self.function_stats = defaultdict(dict)
+        self._chart_fig = None  # 复用的图表Figure，批量分析多个报告时不重复创建
+        
+        # 分类关键字（顺序即匹配优先级），每类预编译为一个正则
+        self._category_patterns = [
+            (cat_name, re.compile('|'.join(map(re.escape, keywords))), field)
+            for cat_name, keywords, field in [
+                # 网络I/O
+                ('Network I/O', ['recvmsg', 'sendmsg', 'recv', 'send', 'socket', 'net'], 'symbol'),
+                # 系统调用
+                ('System Calls', ['syscall', 'sys_', '__sys', 'entry_', 'kernel'], 'symbol'),
+                # WebRTC核心
+                ('WebRTC Core', ['webrtc', 'peerconnection'], 'shared_object'),
+                # 视频处理
+                ('Video Processing', ['video', 'frame', 'decode', 'encode', 'vp8', 'vp9', 'h264'], 'symbol'),
+                # 音频处理
+                ('Audio Processing', ['audio', 'sound', 'pcm', 'opus'], 'symbol'),
+                # 内存管理
+                ('Memory Management', ['malloc', 'free', 'alloc', 'mem', 'copy'], 'symbol'),
+                # 线程相关
+                ('Threading', ['thread', 'pthread', 'lock', 'mutex'], 'symbol'),
+            ]
+        ]
         
     def parse_cpu_analysis_report(self, report_file):
-        """解析CPU分析报告"""
+        """解析CPU分析报告（基于mmap逐行读取，取满热点即停止）"""
         print(f"[*] 分析CPU报告: {report_file}")
         
-        with open(report_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 提取基本信息
-        info = {}
-        info['sampling_duration'] = re.search(r'采集时长: (\d+)秒', content)
-        info['target_processes'] = re.findall(r'目标进程: ([\d\s]+)', content)
-        info['sample_count'] = re.search(r'Samples: (\d+[KM]?)', content)
-        info['event_count'] = re.search(r'Event count \(approx\.\): (\d+)', content)
-        
-        # 解析CPU热点
+        info = {
+            'sampling_duration': None,
+            'target_processes': [],
+            'sample_count': None,
+            'event_count': None,
+            'report_mtime': os.stat(report_file).st_mtime
+        }
         cpu_hotspots = []
-        lines = content.split('\n')
+        header_lines = []
         in_hotspot_section = False
         
-        for line in lines:
-            if 'Children      Self  Command' in line:
-                in_hotspot_section = True
+        for line_num, raw_line in enumerate(self._iter_raw_lines(report_file)):
+            if not in_hotspot_section:
+                # 基本信息只出现在报告头部
+                if line_num < _INFO_SCAN_LINES:
+                    header_lines.append(raw_line.decode('utf-8', errors='ignore'))
+                if b'Children      Self  Command' in raw_line:
+                    in_hotspot_section = True
                 continue
             
-            if in_hotspot_section and line.strip().startswith('#'):
+            # 热点行必含百分号，其余行不解码
+            stripped = raw_line.strip()
+            if not stripped or stripped.startswith(b'#') or b'%' not in stripped:
                 continue
-                
-            if in_hotspot_section and line.strip():
-                # 解析CPU占用行
-                match = re.match(r'\s*(\d+\.\d+)%\s+(\d+\.\d+)%\s+(\w+)\s+([^\s]+)\s+(.+)', line)
-                if match:
-                    children_pct, self_pct, command, shared_obj, symbol = match.groups()
-                    cpu_hotspots.append({
-                        'children_percent': float(children_pct),
-                        'self_percent': float(self_pct),
-                        'command': command,
-                        'shared_object': shared_obj,
-                        'symbol': symbol.split()[0]  # 只取第一部分
-                    })
+            
+            # 解析CPU占用行
+            match = _HOTSPOT_RE.match(raw_line.decode('utf-8', errors='ignore'))
+            if match:
+                children_pct, self_pct, command, shared_obj, symbol = match.groups()
+                cpu_hotspots.append({
+                    'children_percent': float(children_pct),
+                    'self_percent': float(self_pct),
+                    'command': command,
+                    'shared_object': shared_obj,
+                    'symbol': symbol.split()[0]  # 只取第一部分
+                })
+                if len(cpu_hotspots) >= _MAX_HOTSPOTS:
+                    break
+        
+        self._parse_report_info(''.join(header_lines), info)
         
         return {
             'info': info,
-            'hotspots': cpu_hotspots[:20]  # 取前20个热点
+            'hotspots': cpu_hotspots  # 取前20个热点
         }
     
+    def find_analysis_reports(self, directory):
+        """查找目录下的CPU分析报告（*analysis*.txt），返回 [(修改时间, 路径)]"""
+        try:
+            with os.scandir(directory) as entries:
+                return [(entry.stat().st_mtime, entry.path) for entry in entries
+                        if 'analysis' in entry.name and entry.name.endswith('.txt')]
+        except FileNotFoundError:
+            return []
+    
+    def _iter_raw_lines(self, report_file):
+        """通过mmap逐行产出报告的原始字节，避免整个文件读入内存并解码"""
+        with open(report_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from iter(mm.readline, b'')
+    
+    def _parse_report_info(self, header, info):
+        """从报告头部文本中提取基本信息（目标进程列表可能跨多行，因此在整段头部上匹配）"""
+        info['sampling_duration'] = _SAMPLING_DURATION_RE.search(header)
+        info['target_processes'] = _TARGET_PROCESSES_RE.findall(header)
+        info['sample_count'] = _SAMPLE_COUNT_RE.search(header)
+        info['event_count'] = _EVENT_COUNT_RE.search(header)
+    
     def categorize_functions(self, hotspots):
         """将函数按功能分类"""
         categories = {
@@ -78,57 +161,79 @@ class WebRTCCPUAnalyzer:
         }
         
         for hotspot in hotspots:
-            symbol = hotspot['symbol'].lower()
-            shared_obj = hotspot['shared_object'].lower()
+            fields = {
+                'symbol': hotspot['symbol'].lower(),
+                'shared_object': hotspot['shared_object'].lower()
+            }
             
-            # 网络I/O
-            if any(keyword in symbol for keyword in ['recvmsg', 'sendmsg', 'recv', 'send', 'socket', 'net']):
-                categories['Network I/O'].append(hotspot)
-            # 系统调用
-            elif any(keyword in symbol for keyword in ['syscall', 'sys_', '__sys', 'entry_', 'kernel']):
-                categories['System Calls'].append(hotspot)
-            # WebRTC核心
-            elif any(keyword in shared_obj for keyword in ['webrtc', 'peerconnection']):
-                categories['WebRTC Core'].append(hotspot)
-            # 视频处理
-            elif any(keyword in symbol for keyword in ['video', 'frame', 'decode', 'encode', 'vp8', 'vp9', 'h264']):
-                categories['Video Processing'].append(hotspot)
-            # 音频处理
-            elif any(keyword in symbol for keyword in ['audio', 'sound', 'pcm', 'opus']):
-                categories['Audio Processing'].append(hotspot)
-            # 内存管理
-            elif any(keyword in symbol for keyword in ['malloc', 'free', 'alloc', 'mem', 'copy']):
-                categories['Memory Management'].append(hotspot)
-            # 线程相关
-            elif any(keyword in symbol for keyword in ['thread', 'pthread', 'lock', 'mutex']):
-                categories['Threading'].append(hotspot)
+            # 按优先级匹配，命中第一个分类即停止
+            for cat_name, pattern, field in self._category_patterns:
+                if pattern.search(fields[field]):
+                    categories[cat_name].append(hotspot)
+                    break
             else:
                 categories['Other'].append(hotspot)
         
         return categories
     
-    def create_cpu_usage_charts(self, hotspots, output_dir):
+    def summarize_categories(self, categories):
+        """按分类汇总CPU占用（函数数量、总占用、最高占用及其函数），各分类只汇总一次"""
+        names = list(categories.keys())
+        counts = np.array([len(categories[name]) for name in names], dtype=np.intp)
+        
+        # 各分类的函数是连续排列的，分类编号与占用率构成两列数组
+        children = np.fromiter(
+            (func['children_percent'] for name in names for func in categories[name]),
+            dtype=np.float64, count=int(counts.sum())
+        )
+        cat_ids = np.repeat(np.arange(len(names)), counts)
+        starts = np.cumsum(counts) - counts
+        
+        totals = np.bincount(cat_ids, weights=children, minlength=len(names))
+        maxes = np.zeros(len(names))
+        non_empty = counts > 0
+        if children.size:
+            maxes[non_empty] = np.maximum.reduceat(children, starts[non_empty])
+        
+        summary = {}
+        for i in np.flatnonzero(non_empty):
+            start, count = starts[i], counts[i]
+            top_index = int(np.argmax(children[start:start + count]))
+            summary[names[i]] = {
+                'function_count': int(count),
+                'total_cpu_percent': float(totals[i]),
+                'max_cpu_percent': float(maxes[i]),
+                'top_function': categories[names[i]][top_index]['symbol']
+            }
+        
+        return summary
+    
+    def create_cpu_usage_charts(self, hotspots, categories, category_summary, output_dir):
         """创建CPU使用情况图表"""
         print("[*] 生成CPU使用情况图表...")
         
-        # 分类函数
-        categories = self.categorize_functions(hotspots)
-        
-        # 计算每个分类的总CPU占用
-        category_totals = {}
-        for cat_name, funcs in categories.items():
-            total = sum(func['children_percent'] for func in funcs)
-            if total > 0:
-                category_totals[cat_name] = total
+        # 每个分类的总CPU占用
+        category_totals = {
+            cat_name: stats['total_cpu_percent']
+            for cat_name, stats in category_summary.items()
+            if stats['total_cpu_percent'] > 0
+        }
         
-        # 创建图表
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        # 创建图表（复用已有Figure，只清空内容）
+        if self._chart_fig is None:
+            self._chart_fig = plt.figure(figsize=(16, 12))
+        else:
+            self._chart_fig.clear()
+        fig = self._chart_fig
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+        for ax in (ax2, ax3, ax4):
+            ax.spines[['top', 'right']].set_visible(False)
         
         # 1. 按分类的饼图
         if category_totals:
             labels = list(category_totals.keys())
             sizes = list(category_totals.values())
-            colors = plt.cm.Set3(np.linspace(0, 1, len(labels)))
+            colors = _CATEGORY_COLORS[len(labels)]
             
             wedges, texts, autotexts = ax1.pie(sizes, labels=labels, autopct='%1.1f%%', 
                                               colors=colors, startangle=90)
@@ -191,37 +296,38 @@ class WebRTCCPUAnalyzer:
                 ax4.text(bar.get_x() + bar.get_width()/2., height + 0.1,
                         f'{height:.1f}%', ha='center', va='bottom', fontsize=8)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # 保存图表
         output_file = output_dir / "webrtc_cpu_analysis_charts.png"
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        fig.savefig(output_file, dpi=150, bbox_inches='tight')
         print(f"✅ CPU分析图表已保存: {output_file}")
         
-        plt.close()
         return output_file
     
-    def generate_summary_report(self, analysis_data, output_dir):
+    def close_charts(self):
+        """关闭复用的图表Figure，分析器不再出图时调用以释放图表内存"""
+        if self._chart_fig is not None:
+            plt.close(self._chart_fig)
+            self._chart_fig = None
+    
+    def generate_summary_report(self, analysis_data, category_summary, output_dir):
         """生成CPU使用情况摘要报告"""
         print("[*] 生成CPU使用摘要报告...")
         
         hotspots = analysis_data['hotspots']
-        categories = self.categorize_functions(hotspots)
         
         # 计算分类统计
         category_stats = {}
-        for cat_name, funcs in categories.items():
-            if funcs:
-                total_cpu = sum(f['children_percent'] for f in funcs)
-                avg_cpu = total_cpu / len(funcs)
-                max_cpu = max(f['children_percent'] for f in funcs)
-                category_stats[cat_name] = {
-                    'function_count': len(funcs),
-                    'total_cpu_percent': round(total_cpu, 2),
-                    'average_cpu_percent': round(avg_cpu, 2),
-                    'max_cpu_percent': round(max_cpu, 2),
-                    'top_function': max(funcs, key=lambda x: x['children_percent'])['symbol']
-                }
+        for cat_name, stats in category_summary.items():
+            total_cpu = stats['total_cpu_percent']
+            category_stats[cat_name] = {
+                'function_count': stats['function_count'],
+                'total_cpu_percent': round(total_cpu, 2),
+                'average_cpu_percent': round(total_cpu / stats['function_count'], 2),
+                'max_cpu_percent': round(stats['max_cpu_percent'], 2),
+                'top_function': stats['top_function']
+            }
         
         # 生成报告
         report = {
@@ -229,7 +335,7 @@ class WebRTCCPUAnalyzer:
                 'total_hotspots': len(hotspots),
                 'top_cpu_consumer': hotspots[0]['symbol'] if hotspots else 'N/A',
                 'top_cpu_percent': hotspots[0]['children_percent'] if hotspots else 0,
-                'analysis_timestamp': Path(list(self.data_dir.glob('*analysis*.txt'))[0]).stat().st_mtime
+                'analysis_timestamp': analysis_data['info']['report_mtime']
             },
             'category_breakdown': category_stats,
             'performance_insights': self._generate_insights(category_stats, hotspots)
@@ -237,8 +343,7 @@ class WebRTCCPUAnalyzer:
         
         # 保存JSON报告
         report_file = output_dir / "webrtc_cpu_summary.json"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        _dump_json(report, report_file)
         
         # 生成文本报告
         text_report = output_dir / "webrtc_cpu_summary.txt"
@@ -312,9 +417,9 @@ def main():
     analyzer = WebRTCCPUAnalyzer()
     
     # 查找最新的CPU分析报告
-    analysis_files = list(analyzer.data_dir.glob("webrtc_config_results/*analysis*.txt"))
+    analysis_files = analyzer.find_analysis_reports(analyzer.data_dir / "webrtc_config_results")
     if not analysis_files:
-        analysis_files = list(analyzer.data_dir.glob("*analysis*.txt"))
+        analysis_files = analyzer.find_analysis_reports(analyzer.data_dir)
     
     if not analysis_files:
         print("❌ 未找到CPU分析报告文件")
@@ -322,7 +427,7 @@ def main():
         return
     
     # 使用最新的分析文件
-    latest_analysis = max(analysis_files, key=lambda f: f.stat().st_mtime)
+    latest_analysis = Path(max(analysis_files)[1])
     print(f"📊 使用分析文件: {latest_analysis}")
     
     # 解析数据
@@ -338,10 +443,16 @@ def main():
     output_dir = analyzer.data_dir / "analysis_results"
     output_dir.mkdir(exist_ok=True)
     
-    chart_file = analyzer.create_cpu_usage_charts(analysis_data['hotspots'], output_dir)
+    # 分类函数并汇总（图表和摘要报告共用）
+    categories = analyzer.categorize_functions(analysis_data['hotspots'])
+    category_summary = analyzer.summarize_categories(categories)
+    
+    chart_file = analyzer.create_cpu_usage_charts(analysis_data['hotspots'], categories,
+                                                  category_summary, output_dir)
+    analyzer.close_charts()
     
     # 生成摘要报告
-    report_files = analyzer.generate_summary_report(analysis_data, output_dir)
+    report_files = analyzer.generate_summary_report(analysis_data, category_summary, output_dir)
     
     print("")
     print("🎉 CPU使用情况分析完成!")
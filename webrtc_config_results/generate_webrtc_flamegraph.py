@@ -11,13 +11,73 @@ WebRTC传输过程火焰图生成器
 """
 
 import re
+import os
 import json
+import mmap
 import subprocess
 import sys
+import zlib
+from html import escape
 from pathlib import Path
-from collections import defaultdict, deque
+from collections import defaultdict, deque, Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json(obj, path):
+    """写出缩进2格的UTF-8 JSON文件，安装了orjson时直接序列化为字节"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+# 小于该大小的日志串行解析，进程池的启动和结果传输开销不划算
+PARALLEL_PARSE_MIN_BYTES = 64 * 1024 * 1024
+
+
+def _int_after(text, key):
+    """返回text中紧跟在key之后的第一个整数，找不到时返回None（等价于 re.search(key + r'(\d+)')）"""
+    start = text.find(key)
+    while start != -1:
+        start += len(key)
+        end = start
+        while end < len(text) and text[end].isdecimal():
+            end += 1
+        if end > start:
+            return int(text[start:end])
+        start = text.find(key, start)
+    return None
+
+
+def _parse_log_chunk(log_file_path, output_dir, start, end):
+    """在工作进程中解析日志的一个字节范围，返回该范围内的事件、按功能累计的耗时和行数
+
+    行号从该范围的第1行算起，由主进程按前面各段的行数平移
+    """
+    generator = WebRTCFlameGraphGenerator(log_file_path, output_dir)
+    line_count = generator._parse_raw_lines(generator._iter_raw_lines(start, end), 1)
+    return generator.timeline_data, generator.function_totals, line_count
+
+
+def _aggregate_categories(cat_ids, durations, n_cats):
+    """按分类编号汇总事件数、总耗时和最大耗时（NumPy向量化实现）"""
+    counts = np.bincount(cat_ids, minlength=n_cats)
+    totals = np.zeros(n_cats, dtype=np.int64)
+    np.add.at(totals, cat_ids, durations)
+    maxes = np.zeros(n_cats, dtype=np.int64)
+    np.maximum.at(maxes, cat_ids, durations)
+    return counts, totals, maxes
+
+
 class WebRTCFlameGraphGenerator:
     def __init__(self, log_file_path, output_dir="webrtc_config_results"):
         self.log_file_path = log_file_path
@@ -32,6 +92,7 @@ class WebRTCFlameGraphGenerator:
         # 时间序列数据存储
         self.timeline_data = []
         self.function_stack_data = defaultdict(list)
+        self.function_totals = Counter()  # 按功能累计耗时，在添加事件时同步更新
         
         # 日志解析模式
         self.patterns = {
@@ -46,36 +107,88 @@ class WebRTCFlameGraphGenerator:
             
             # RTP/RTCP处理
             'rtp_receive': re.compile(r'\(([^)]+)\): (\w+): (.+)'),
-            'thread_timing': re.compile(r'\(thread\.cc:\d+\): Message to Thread .+ took (\d+)ms'),
-            
-            # 编码解码相关
-            'codec_timing': re.compile(r'decode_ms: (\d+), max_decode_ms: (\d+)'),
-            'frame_timing': re.compile(r'Frames Received: (\d+), Frames Decoded: (\d+), .+FPS: (\d+)')
+            'thread_timing': re.compile(r'\(thread\.cc:\d+\): Message to Thread .+ took (\d+)ms')
         }
+        
+        # 行过滤正则：各类事件模式的并集，不含任何事件的行一次匹配即跳过
+        # 分支按首字符 '[' / '(' 提取公共前缀，保留正则引擎的字面量快速扫描
+        # 直接匹配原始字节行，只有命中的行才解码
+        self.line_pattern = re.compile(
+            rb'\[(?:VideoQuality-[^\]]+\] Time: \d+'
+            rb'|GCC-DECISION-SNAPSHOT\] at \d+ms \||[^-]+BWE-[^\]]+\] Time: \d+ ms, )'
+            rb'|\((?:thread\.cc:\d+\): Message to Thread '
+            rb'|[^)]+\): \w+: )'
+        )
+        # 通过过滤的行再按类别逐一检查，同一行可能同时属于多个类别，命中的解析函数都要执行
+        # （顺序与逐个调用全部解析函数时一致）
+        self.line_handlers = [
+            (re.compile(rb'\[VideoQuality-[^\]]+\] Time: \d+'), self._parse_video_quality_events),
+            (re.compile(rb'\[(?:GCC-DECISION-SNAPSHOT\] at \d+ms \||[^-]+BWE-[^\]]+\] Time: \d+ ms, )'),
+             self._parse_gcc_events),
+            (re.compile(rb'\([^)]+\): \w+: '), self._parse_rtp_events),
+            (re.compile(rb'\(thread\.cc:\d+\): Message to Thread '), self._parse_thread_timing)
+        ]
 
-    def parse_webrtc_logs(self):
+    def parse_webrtc_logs(self, max_workers=None):
         """解析WebRTC日志，提取时间序列数据"""
         print(f"[*] 解析日志文件: {self.log_file_path}")
         
-        with open(self.log_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-        
-        start_time = None
-        current_time = 0
-        
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line:
-                continue
-                
-            # 提取时间戳和函数调用信息
-            self._parse_video_quality_events(line, line_num)
-            self._parse_gcc_events(line, line_num) 
-            self._parse_rtp_events(line, line_num)
-            self._parse_thread_timing(line, line_num)
+        workers = max_workers or os.cpu_count() or 1
+        if workers > 1 and os.path.getsize(self.log_file_path) >= PARALLEL_PARSE_MIN_BYTES:
+            self._parse_parallel(workers)
+        else:
+            self._parse_raw_lines(self._iter_raw_lines(), 1)
             
         print(f"[*] 解析完成，共提取 {len(self.timeline_data)} 个事件")
 
+    def _parse_raw_lines(self, raw_lines, first_line_num):
+        """逐行过滤并分派到所有命中类别的解析函数，返回处理的行数"""
+        line_num = first_line_num - 1
+        for line_num, raw_line in enumerate(raw_lines, first_line_num):
+            # 提取时间戳和函数调用信息
+            if self.line_pattern.search(raw_line):
+                line = raw_line.decode('utf-8', errors='ignore').strip()
+                for pattern, handler in self.line_handlers:
+                    if pattern.search(raw_line):
+                        handler(line, line_num)
+        return line_num - first_line_num + 1
+
+    def _parse_parallel(self, workers):
+        """按换行对齐把日志切成多段，用进程池并行解析后按顺序合并"""
+        with open(self.log_file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                edges = [0]
+                for i in range(1, workers):
+                    edges.append((mm.find(b'\n', max(size * i // workers, edges[-1])) + 1) or size)
+                edges.append(size)
+        chunks = [(start, end) for start, end in zip(edges, edges[1:]) if start < end]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_parse_log_chunk, *zip(*[
+                (self.log_file_path, str(self.output_dir), start, end) for start, end in chunks
+            ]))
+            # 各段按段内行号解析，合并时累加前面各段的行数换算成全局行号
+            line_offset = 0
+            for timeline_data, function_totals, line_count in results:
+                if line_offset:
+                    self._shift_line_events(timeline_data, function_totals, line_offset)
+                self.timeline_data.extend(timeline_data)
+                self.function_totals.update(function_totals)
+                line_offset += line_count
+
+    def _iter_raw_lines(self, start=0, end=None):
+        """通过mmap逐行产出日志 [start, end) 范围的原始字节，避免整个文件读入内存并解码"""
+        with open(self.log_file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if end is None:
+                    end = len(mm)
+                mm.seek(start)
+                while mm.tell() < end:
+                    yield mm.readline()
+
     def _parse_video_quality_events(self, line, line_num):
         """解析视频质量相关事件"""
         match = self.patterns['video_quality'].search(line)
@@ -84,30 +197,25 @@ class WebRTCFlameGraphGenerator:
             timestamp = int(timestamp)
             
             # 提取具体参数
-            if 'FPS:' in details:
-                fps_match = re.search(r'FPS: (\d+)', details)
-                if fps_match:
-                    fps = int(fps_match.group(1))
-                    self._add_timeline_event(timestamp, f"VideoQuality.{event_type}.ProcessFrame", fps * 10)
+            fps = _int_after(details, 'FPS: ')
+            if fps is not None:
+                self._add_timeline_event(timestamp, f"VideoQuality.{event_type}.ProcessFrame", fps * 10)
                     
-            if 'decode_ms:' in details:
-                decode_match = re.search(r'decode_ms: (\d+)', details)
-                if decode_match:
-                    decode_time = int(decode_match.group(1))
-                    if decode_time > 0:
-                        self._add_timeline_event(timestamp, f"VideoQuality.{event_type}.Decode", decode_time)
+            decode_time = _int_after(details, 'decode_ms: ')
+            if decode_time is not None and decode_time > 0:
+                self._add_timeline_event(timestamp, f"VideoQuality.{event_type}.Decode", decode_time)
 
     def _parse_gcc_events(self, line, line_num):
         """解析GCC拥塞控制事件"""
-        # GCC决策快照
-        match = self.patterns['gcc_decision'].search(line)
+        # GCC决策快照（先做字面量子串检查，不含标签的行不启动正则）
+        match = '[GCC-DECISION-SNAPSHOT]' in line and self.patterns['gcc_decision'].search(line)
         if match:
             timestamp, details = match.groups()
             timestamp = int(timestamp)
             self._add_timeline_event(timestamp, "GCC.DecisionSnapshot", 5)
             
         # BWE事件
-        match = self.patterns['gcc_bwe'].search(line)
+        match = 'BWE-' in line and self.patterns['gcc_bwe'].search(line)
         if match:
             event_type, timestamp, details = match.groups()
             timestamp = int(timestamp)
@@ -134,31 +242,40 @@ class WebRTCFlameGraphGenerator:
             timestamp = line_num * 100
             self._add_timeline_event(timestamp, "Threading.MessageDispatch", duration_ms)
 
+    @staticmethod
+    def _shift_line_events(timeline_data, function_totals, line_offset):
+        """把按段内行号生成的事件平移line_offset行（与 _parse_rtp_events / _parse_thread_timing 的行号换算一致）"""
+        for event in timeline_data:
+            function = event['function']
+            if function.startswith('RTP.'):
+                # 时间戳和估算耗时都由行号得出
+                line_num = event['timestamp'] // 100 + line_offset
+                estimated_time = max(1, line_num % 50)
+                function_totals[function] += estimated_time - event['duration']
+                event['timestamp'] = line_num * 100
+                event['duration'] = estimated_time
+            elif function == 'Threading.MessageDispatch':
+                event['timestamp'] += line_offset * 100
+
     def _add_timeline_event(self, timestamp, function_name, duration_ms):
         """添加时间线事件"""
         self.timeline_data.append({
             'timestamp': timestamp,
             'function': function_name,
-            'duration': duration_ms
+            'duration': duration_ms,
+            'category': function_name.partition('.')[0]
         })
+        self.function_totals[function_name] += duration_ms
 
     def generate_flame_graph_data(self):
         """生成火焰图数据格式"""
         print("[*] 生成火焰图数据...")
         
-        # 按时间排序事件
-        self.timeline_data.sort(key=lambda x: x['timestamp'])
-        
         # 构建调用栈数据
         stack_data = []
         
-        # 按功能分组统计
-        function_stats = defaultdict(int)
-        for event in self.timeline_data:
-            function_stats[event['function']] += event['duration']
-        
-        # 生成折叠堆栈格式
-        for function, total_duration in function_stats.items():
+        # 生成折叠堆栈格式（按功能的累计耗时已在添加事件时统计）
+        for function, total_duration in self.function_totals.items():
             # 创建分层调用栈
             parts = function.split('.')
             if len(parts) >= 2:
@@ -169,8 +286,9 @@ class WebRTCFlameGraphGenerator:
         
         return stack_data
 
-    def create_flamegraph_svg(self, stack_data, output_filename="webrtc_transmission_flamegraph.svg"):
-        """使用FlameGraph工具生成SVG火焰图"""
+    def create_flamegraph_svg(self, stack_data, output_filename="webrtc_transmission_flamegraph.svg",
+                              legacy_perl=False):
+        """生成SVG火焰图（默认直接由Python输出，legacy_perl=True时调用FlameGraph工具）"""
         print(f"[*] 生成火焰图: {output_filename}")
         
         # 写入中间数据文件
@@ -178,15 +296,109 @@ class WebRTCFlameGraphGenerator:
         with open(stack_file, 'w') as f:
             f.write('\n'.join(stack_data))
         
-        # 生成火焰图
         output_svg = self.output_dir / output_filename
+        title = "WebRTC传输过程火焰图"
+        subtitle = f"基于日志: {Path(self.log_file_path).name}"
+        
+        if legacy_perl:
+            return self._run_flamegraph_pl(stack_file, output_svg, title, subtitle)
+        
+        svg = self._render_flamegraph_svg(stack_data, title, subtitle)
+        if svg is None:
+            print("❌ 火焰图生成失败: 调用栈总耗时为0")
+            return None
+        
+        with open(output_svg, 'w', encoding='utf-8') as f:
+            f.write(svg)
+        print(f"✅ 火焰图生成成功: {output_svg}")
+        return output_svg
+
+    def _render_flamegraph_svg(self, stack_data, title, subtitle, width=1200, frame_height=16):
+        """把折叠堆栈渲染为SVG火焰图，布局与配色参照flamegraph.pl的hot方案"""
+        # 按分号前缀合并调用栈，构建帧树
+        root = {'value': 0, 'children': {}}
+        for entry in stack_data:
+            stack, _, value = entry.rpartition(' ')
+            value = int(value)
+            node = root
+            node['value'] += value
+            for frame in stack.split(';'):
+                node = node['children'].setdefault(frame, {'value': 0, 'children': {}})
+                node['value'] += value
+        
+        total = root['value']
+        if total <= 0:
+            return None
+        
+        def max_depth(node):
+            return 1 + max((max_depth(child) for child in node['children'].values()), default=0)
+        
+        pad_top, pad_bottom, pad_side = 60, 20, 10
+        font_size = 12
+        depth = max_depth(root)
+        height = pad_top + depth * frame_height + pad_bottom
+        scale = (width - 2 * pad_side) / total
+        
+        parts = [
+            '<?xml version="1.0" standalone="no"?>',
+            f'<svg version="1.1" width="{width}" height="{height}" viewBox="0 0 {width} {height}" '
+            'xmlns="http://www.w3.org/2000/svg">',
+            '<defs><linearGradient id="background" y1="0" y2="1" x1="0" x2="0">'
+            '<stop stop-color="#eeeeee" offset="5%"/><stop stop-color="#eeeeb0" offset="95%"/>'
+            '</linearGradient></defs>',
+            f'<rect x="0" y="0" width="{width}" height="{height}" fill="url(#background)"/>',
+            f'<text x="{width / 2}" y="24" text-anchor="middle" font-family="Verdana" '
+            f'font-size="17">{escape(title)}</text>',
+            f'<text x="{width / 2}" y="44" text-anchor="middle" font-family="Verdana" '
+            f'font-size="12" fill="#a0a0a0">{escape(subtitle)}</text>',
+        ]
+        
+        def emit(name, node, x, level):
+            frame_width = node['value'] * scale
+            if frame_width < 0.1:
+                return  # 过窄的帧不绘制
+            y = height - pad_bottom - (level + 1) * frame_height
+            
+            # hot配色：按函数名哈希取色，同名函数颜色稳定
+            h = zlib.crc32(name.encode('utf-8'))
+            r = 205 + (h & 0xff) * 50 // 255
+            g = ((h >> 8) & 0xff) * 230 // 255
+            b = ((h >> 16) & 0xff) * 55 // 255
+            
+            label = ''
+            max_chars = int(frame_width / (font_size * 0.59))
+            if max_chars >= 3:
+                label = name if len(name) <= max_chars else name[:max_chars - 2] + '..'
+            
+            percent = node['value'] * 100.0 / total
+            parts.append(
+                f'<g><title>{escape(name)} ({node["value"]}ms, {percent:.2f}%)</title>'
+                f'<rect x="{x:.1f}" y="{y}" width="{frame_width:.1f}" height="{frame_height - 1}" '
+                f'fill="rgb({r},{g},{b})" rx="2" ry="2"/>'
+                f'<text x="{x + 3:.1f}" y="{y + frame_height - 4}" font-family="Verdana" '
+                f'font-size="{font_size}">{escape(label)}</text></g>'
+            )
+            
+            # 子帧按名称排序，与flamegraph.pl一致
+            child_x = x
+            for child_name in sorted(node['children']):
+                child = node['children'][child_name]
+                emit(child_name, child, child_x, level + 1)
+                child_x += child['value'] * scale
+        
+        emit('all', root, pad_side, 0)
+        parts.append('</svg>')
+        return '\n'.join(parts)
+
+    def _run_flamegraph_pl(self, stack_file, output_svg, title, subtitle):
+        """调用FlameGraph工具的flamegraph.pl生成SVG火焰图"""
         flamegraph_script = self.flamegraph_path / "flamegraph.pl"
         
         try:
             cmd = [
                 "perl", str(flamegraph_script),
-                "--title", "WebRTC传输过程火焰图",
-                "--subtitle", f"基于日志: {Path(self.log_file_path).name}",
+                "--title", title,
+                "--subtitle", subtitle,
                 "--width", "1200",
                 "--height", "800",
                 "--colors", "hot"
@@ -214,19 +426,12 @@ class WebRTCFlameGraphGenerator:
             import plotly.graph_objects as go
             import plotly.express as px
             from plotly.subplots import make_subplots
+            import pandas as pd
             
             print("[*] 生成交互式火焰图...")
             
-            # 准备数据
-            functions = []
-            durations = []
-            categories = []
-            
-            for event in self.timeline_data:
-                parts = event['function'].split('.')
-                functions.append(event['function'])
-                durations.append(event['duration'])
-                categories.append(parts[0] if parts else 'Other')
+            # 准备数据：列式存储，直接以NumPy数组交给Plotly序列化
+            events_df = pd.DataFrame(self.timeline_data, columns=['timestamp', 'function', 'duration'])
             
             # 创建火焰图风格的可视化
             fig = make_subplots(
@@ -235,12 +440,8 @@ class WebRTCFlameGraphGenerator:
                 vertical_spacing=0.12
             )
             
-            # 上部分：按功能分组的耗时分布
-            function_stats = defaultdict(int)
-            for i, func in enumerate(functions):
-                function_stats[func] += durations[i]
-            
-            sorted_functions = sorted(function_stats.items(), key=lambda x: x[1], reverse=True)[:20]
+            # 上部分：按功能分组的耗时分布（累计耗时已在添加事件时统计）
+            sorted_functions = self.function_totals.most_common(20)
             
             fig.add_trace(
                 go.Bar(
@@ -256,14 +457,14 @@ class WebRTCFlameGraphGenerator:
             # 下部分：时间序列散点图
             fig.add_trace(
                 go.Scatter(
-                    x=[e['timestamp'] for e in self.timeline_data],
-                    y=[e['duration'] for e in self.timeline_data],
+                    x=events_df['timestamp'].to_numpy(),
+                    y=events_df['duration'].to_numpy(),
                     mode='markers',
                     name="事件时间线",
-                    text=[e['function'] for e in self.timeline_data],
+                    text=events_df['function'].to_numpy(),
                     marker=dict(
                         size=8,
-                        color=[e['duration'] for e in self.timeline_data],
+                        color=events_df['duration'].to_numpy(),
                         colorscale='Hot',
                         showscale=True,
                         colorbar=dict(title="耗时 (ms)")
@@ -299,53 +500,57 @@ class WebRTCFlameGraphGenerator:
         """生成性能分析摘要报告"""
         print("[*] 生成性能分析报告...")
         
-        # 统计各类事件
-        category_stats = defaultdict(lambda: {'count': 0, 'total_time': 0, 'max_time': 0})
-        
-        for event in self.timeline_data:
-            category = event['function'].split('.')[0]
-            duration = event['duration']
-            
-            category_stats[category]['count'] += 1
-            category_stats[category]['total_time'] += duration
-            category_stats[category]['max_time'] = max(category_stats[category]['max_time'], duration)
+        # 统计各类事件：分类按首次出现顺序编号，转成两列数组后单次汇总
+        category_index = {}
+        cat_ids = np.fromiter(
+            (category_index.setdefault(event['category'], len(category_index))
+             for event in self.timeline_data),
+            dtype=np.int64, count=len(self.timeline_data)
+        )
+        durations = np.fromiter((event['duration'] for event in self.timeline_data),
+                                dtype=np.int64, count=len(self.timeline_data))
+        counts, totals, maxes = _aggregate_categories(cat_ids, durations, len(category_index))
         
         # 生成报告
         report = {
             'summary': {
                 'total_events': len(self.timeline_data),
-                'total_time_ms': sum(e['duration'] for e in self.timeline_data),
+                'total_time_ms': int(totals.sum()),
                 'analysis_timestamp': datetime.now().isoformat()
             },
             'categories': {}
         }
         
-        for category, stats in category_stats.items():
-            avg_time = stats['total_time'] / stats['count'] if stats['count'] > 0 else 0
+        for category, i in category_index.items():
+            count, total_time = int(counts[i]), int(totals[i])
+            avg_time = total_time / count if count > 0 else 0
             report['categories'][category] = {
-                'event_count': stats['count'],
-                'total_time_ms': stats['total_time'],
+                'event_count': count,
+                'total_time_ms': total_time,
                 'average_time_ms': round(avg_time, 2),
-                'max_time_ms': stats['max_time']
+                'max_time_ms': int(maxes[i])
             }
         
         # 保存报告
         report_file = self.output_dir / "webrtc_performance_report.json"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        _dump_json(report, report_file)
         
         print(f"✅ 性能报告生成成功: {report_file}")
         return report_file
 
 def main():
-    if len(sys.argv) < 2:
+    args = [arg for arg in sys.argv[1:] if arg != '--legacy-perl']
+    legacy_perl = len(args) != len(sys.argv) - 1
+    
+    if len(args) < 1:
         print("🎯 WebRTC传输过程火焰图生成器")
-        print("用法: python3 generate_webrtc_flamegraph.py <log_file> [output_dir]")
+        print("用法: python3 generate_webrtc_flamegraph.py <log_file> [output_dir] [--legacy-perl]")
         print("示例: python3 generate_webrtc_flamegraph.py receiver_cloud.log")
+        print("      --legacy-perl  使用FlameGraph工具的flamegraph.pl生成SVG")
         return
     
-    log_file = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else "webrtc_config_results"
+    log_file = args[0]
+    output_dir = args[1] if len(args) > 1 else "webrtc_config_results"
     
     if not Path(log_file).exists():
         print(f"❌ 日志文件不存在: {log_file}")
@@ -364,7 +569,7 @@ def main():
     
     if stack_data:
         # 生成SVG火焰图
-        svg_file = generator.create_flamegraph_svg(stack_data)
+        svg_file = generator.create_flamegraph_svg(stack_data, legacy_perl=legacy_perl)
         
         # 生成交互式火焰图
         html_file = generator.generate_interactive_flamegraph()
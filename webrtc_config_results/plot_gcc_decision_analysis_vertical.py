@@ -8,312 +8,217 @@ Delay-based, RTT backoff, Probe-based, and Loss-based bandwidth estimation.
 """
 
 import re
+import os
+import mmap
+import matplotlib
+# Charts are only ever written to files, so never initialise a GUI toolkit
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+# Resolve the plot style once at import instead of on every chart
+try:
+    plt.style.use('seaborn-v0_8-whitegrid')
+except:
+    plt.style.use('default')
+
+# Let Agg drop sub-pixel detail from long paths and render them in chunks
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+
+# Timestamp carried by most log lines; only consulted for old-format probe entries
+_TS_RE = re.compile(rb'Time: (\d+) ms|at (\d+) ms')
+
+# Upper bound on the points drawn per line plot; longer series are MinMax-downsampled
+PLOT_MAX_POINTS = 4000
+
+# Range check for narrowing parsed integer columns
+_INT32 = np.iinfo(np.int32)
+
+# Shared result for tables with no matching log lines; only ever read
+_EMPTY_FRAME = pd.DataFrame()
+
+# Logs smaller than this are parsed serially; process start-up and result
+# transfer would cost more than the parallel scan saves
+PARALLEL_PARSE_MIN_BYTES = 64 * 1024 * 1024
+
+# Series longer than this are drawn as bare lines; per-sample markers only clutter
+DENSE_LINE_POINTS = 2000
+
+
+def _line_marker(count):
+    """Marker for a line plot of `count` samples."""
+    return 'o' if count <= DENSE_LINE_POINTS else 'None'
+
+
+def _plot_rows(*series, n_out=PLOT_MAX_POINTS):
+    """
+    MinMax downsampling for line plots: split the rows into equal buckets and
+    keep each bucket's minimum and maximum row for every array in series, plus
+    the first and last row, so peaks survive. Returns sorted row positions, or
+    slice(None) when the series are already short enough to draw in full.
+    """
+    n = len(series[0])
+    if n <= n_out:
+        return slice(None)
+    bucket = -(-n // max(1, n_out // (2 * len(series))))
+    n_buckets = -(-n // bucket)
+    offsets = np.arange(n_buckets) * bucket
+    keep = [np.array([0, n - 1])]
+    for column in series:
+        values = np.full(n_buckets * bucket, np.nan)
+        values[:n] = column
+        values = values.reshape(n_buckets, bucket)
+        missing = np.isnan(values)
+        keep.append(offsets + np.where(missing, np.inf, values).argmin(axis=1))
+        keep.append(offsets + np.where(missing, -np.inf, values).argmax(axis=1))
+    return np.unique(np.concatenate(keep))
+
+
+def _parse_log_chunk(log_file_path, start, end):
+    """Parse one newline-aligned byte range of the log in a worker process."""
+    analyzer = GccDecisionAnalyzer(log_file_path)
+    analyzer._columns = analyzer._empty_columns()
+    with open(log_file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            analyzer._scan_buffer(buf, start, end)
+    return analyzer._columns
+
 
 class GccDecisionAnalyzer:
     """
     A specialized class for parsing and visualizing GCC decision process logs.
     """
+    # Column layout of each parsed table; rows are collected column-wise
+    COLUMNS = {
+        'trendline': ('timestamp', 'modified_trend', 'threshold', 'state'),
+        'rtt': ('timestamp', 'corrected_rtt', 'rtt_limit', 'above_limit'),
+        'loss': ('timestamp', 'state', 'bandwidth', 'observations', 'candidates'),
+        'probe': ('timestamp', 'cluster_id', 'estimate', 'source'),
+        'decision': ('timestamp', 'decision_reason'),
+        'constraint_apply': ('timestamp', 'original', 'upper_limit', 'after_upper', 'min_config',
+                             'final', 'delay_limit', 'receiver_limit', 'max_config'),
+        'delay_limit': ('timestamp', 'old_limit', 'new_limit', 'current_target'),
+        'receiver_limit': ('timestamp', 'old_limit', 'new_limit', 'current_target'),
+        'config_limit': ('timestamp', 'old_min', 'new_min', 'old_max', 'new_max', 'current_target'),
+        'pushback': ('timestamp', 'original_rate', 'pushback_rate', 'min_bitrate', 'reduction', 'reduction_ratio'),
+    }
+
     def __init__(self, log_file_path):
         self.log_file_path = log_file_path
         
+        # Figures reused when the same analyzer plots several times (batch mode)
+        self._metrics_fig = None
+        self._constraint_fig = None
+        # Time origins (ms) of the two charts; parsed frames carry time_s relative to them
+        self.start_time_ms = None
+        self.constraint_start_time_ms = None
+        # Line artists of the metrics figure, updated in place while its layout holds
+        self._artists = {}
+        self._metrics_axes = None
+        self._metrics_layout = None
+        self._metrics_transient = []
+        
         # Regular expressions to match key log entries
         self.patterns = {
             # GCC Decision Snapshot
-            'decision': re.compile(r'\[GCC-DECISION-SNAPSHOT\] at (\d+)ms \| DelayState: (\w+), DelayTargetBps: (\d+) \| RttBackoff: (\w+) \| ProbeResultBps: (\d+) \| BweTargetBps: (\d+) \| AckedBitrateBps: (\d+) \| FinalTargetBps: (\d+) \| DecisionReason: (\w+) \| Updated: (\w+)'),
+            'decision': re.compile(rb'\[GCC-DECISION-SNAPSHOT\] at (\d+)ms \| DelayState: (\w+), DelayTargetBps: (\d+) \| RttBackoff: (\w+) \| ProbeResultBps: (\d+) \| BweTargetBps: (\d+) \| AckedBitrateBps: (\d+) \| FinalTargetBps: (\d+) \| DecisionReason: (\w+) \| Updated: (\w+)'),
             # Trendline analysis (Delay BWE internal)
-            'trendline': re.compile(r'\[Trendline\] Time: (\d+) ms.*?Modified trend: ([^,]+), Threshold: ([^,]+), State: (\w+)'),
+            'trendline': re.compile(rb'\[Trendline\] Time: (\d+) ms.*?Modified trend: ([^,]+), Threshold: ([^,]+), State: (\w+)'),
             # RTT BWE internal parameters
-            'rtt_bwe': re.compile(r'\[RttBWE-Update\] Time: (\d+) ms, PropagationRtt: (\d+) ms, CorrectedRtt: (\d+) ms, RttLimit: (\d+) ms, AboveLimit: (\w+)'),
+            'rtt_bwe': re.compile(rb'\[RttBWE-Update\] Time: (\d+) ms, PropagationRtt: (\d+) ms, CorrectedRtt: (\d+) ms, RttLimit: (\d+) ms, AboveLimit: (\w+)'),
             # Loss BWE internal parameters  
-            'loss_bwe': re.compile(r'\[LossBWE-Estimate\] Time: (\d+) ms, State: (\d+), Bandwidth: (\d+) bps, Observations: (\d+)'),
+            'loss_bwe': re.compile(rb'\[LossBWE-Estimate\] Time: (\d+) ms, State: (\d+), Bandwidth: (\d+) bps, Observations: (\d+)'),
             # Loss BWE candidates
-            'loss_candidates': re.compile(r'\[LossBWE-Candidates\] Time: (\d+) ms, Candidate Bandwidths \(kbps\): (.+)'),
+            'loss_candidates': re.compile(rb'\[LossBWE-Candidates\] Time: (\d+) ms, Candidate Bandwidths \(kbps\): (.+)'),
             # Delay BWE decisions
-            'delay_bwe': re.compile(r'\[DelayBWE-Decision\] Time: (\d+) ms.*?New bitrate: (\d+) bps.*?Probe: (\w+)'),
+            'delay_bwe': re.compile(rb'\[DelayBWE-Decision\] Time: (\d+) ms.*?New bitrate: (\d+) bps.*?Probe: (\w+)'),
             # Probe results: Updated patterns for timestamped logs
-            'probe_result': re.compile(r'\[ProbeBWE-Result\] Time: (\d+) ms, Cluster ID: (\d+), Final estimate: (\d+) bps'),
-            'probe_success': re.compile(r'\[ProbeBWE-Success\] Time: (\d+) ms, Cluster ID: (\d+), Send rate: (\d+) bps'),
+            'probe_result': re.compile(rb'\[ProbeBWE-Result\] Time: (\d+) ms, Cluster ID: (\d+), Final estimate: (\d+) bps'),
+            'probe_success': re.compile(rb'\[ProbeBWE-Success\] Time: (\d+) ms, Cluster ID: (\d+), Send rate: (\d+) bps'),
             # Fallback patterns for old format (without timestamps)
-            'probe_result_old': re.compile(r'\[ProbeBWE-Result\] Cluster ID: (\d+), Final estimate: (\d+) bps'),
-            'probe_success_old': re.compile(r'\[ProbeBWE-Success\] Cluster ID: (\d+), Send rate: (\d+) bps'),
+            'probe_result_old': re.compile(rb'\[ProbeBWE-Result\] Cluster ID: (\d+), Final estimate: (\d+) bps'),
+            'probe_success_old': re.compile(rb'\[ProbeBWE-Success\] Cluster ID: (\d+), Send rate: (\d+) bps'),
             
             # New constraint tracking patterns
-            'constraint_apply': re.compile(r'\[BWE-ConstraintApply\] Time: (\d+) ms, Original: (\d+) bps, UpperLimit: (\d+) bps, AfterUpper: (\d+) bps, MinConfig: (\d+) bps, Final: (\d+) bps, DelayLimit: (\d+) bps, ReceiverLimit: (\d+) bps, MaxConfig: (\d+) bps'),
-            'delay_limit': re.compile(r'\[BWE-DelayLimit\] Time: (\d+) ms, OldLimit: (\d+) bps, NewLimit: (\d+) bps, CurrentTarget: (\d+) bps'),
-            'receiver_limit': re.compile(r'\[BWE-ReceiverLimit\] Time: (\d+) ms, OldLimit: (\d+) bps, NewLimit: (\d+) bps, CurrentTarget: (\d+) bps'),
-            'config_limit': re.compile(r'\[BWE-ConfigLimit\] MinBitrate: (\d+) -> (\d+) bps, MaxBitrate: (\d+) -> (\d+) bps, CurrentTarget: (\d+) bps'),
-            'pushback': re.compile(r'\[BWE-CongestionWindowPushback\] Time: (\d+) ms, OriginalRate: (\d+) bps, PushbackRate: (\d+) bps, MinBitrate: (\d+) bps, Reduction: (\d+) bps, ReductionRatio: ([^%]+)%')
+            'constraint_apply': re.compile(rb'\[BWE-ConstraintApply\] Time: (\d+) ms, Original: (\d+) bps, UpperLimit: (\d+) bps, AfterUpper: (\d+) bps, MinConfig: (\d+) bps, Final: (\d+) bps, DelayLimit: (\d+) bps, ReceiverLimit: (\d+) bps, MaxConfig: (\d+) bps'),
+            'delay_limit': re.compile(rb'\[BWE-DelayLimit\] Time: (\d+) ms, OldLimit: (\d+) bps, NewLimit: (\d+) bps, CurrentTarget: (\d+) bps'),
+            'receiver_limit': re.compile(rb'\[BWE-ReceiverLimit\] Time: (\d+) ms, OldLimit: (\d+) bps, NewLimit: (\d+) bps, CurrentTarget: (\d+) bps'),
+            'config_limit': re.compile(rb'\[BWE-ConfigLimit\] MinBitrate: (\d+) -> (\d+) bps, MaxBitrate: (\d+) -> (\d+) bps, CurrentTarget: (\d+) bps'),
+            'pushback': re.compile(rb'\[BWE-CongestionWindowPushback\] Time: (\d+) ms, OriginalRate: (\d+) bps, PushbackRate: (\d+) bps, MinBitrate: (\d+) bps, Reduction: (\d+) bps, ReductionRatio: ([^%]+)%')
+        }
+
+        # Bracketed tag -> (parse, handler) candidates. parse(line) gets the line
+        # starting at its tag (so anchored match() is enough) and returns the
+        # fields handed to handler, or None when the line does not fit; tags
+        # shared by several formats list the timestamped (new) layout first.
+        patterns = self.patterns
+        self.tag_dispatch = {
+            b'[Trendline]': ((patterns['trendline'].match, self._on_trendline),),
+            b'[RttBWE-Update]': ((patterns['rtt_bwe'].match, self._on_rtt_bwe),),
+            b'[LossBWE-Estimate]': ((patterns['loss_bwe'].match, self._on_loss_bwe),),
+            b'[LossBWE-Candidates]': ((patterns['loss_candidates'].match, self._on_loss_candidates),),
+            b'[ProbeBWE-Result]': ((patterns['probe_result'].match, self._on_probe_result),
+                                   (patterns['probe_result_old'].match, self._on_probe_result_old)),
+            b'[ProbeBWE-Success]': ((patterns['probe_success'].match, self._on_probe_success),
+                                    (patterns['probe_success_old'].match, self._on_probe_success_old)),
+            b'[GCC-DECISION-SNAPSHOT]': ((self._split_decision, self._on_decision),),
+            b'[BWE-ConstraintApply]': ((patterns['constraint_apply'].match, self._on_constraint_apply),),
+            b'[BWE-DelayLimit]': ((patterns['delay_limit'].match, self._on_delay_limit),),
+            b'[BWE-ReceiverLimit]': ((patterns['receiver_limit'].match, self._on_receiver_limit),),
+            b'[BWE-CongestionWindowPushback]': ((patterns['pushback'].match, self._on_pushback),),
         }
+        # One scan over the whole buffer finds every tagged entry
+        self.tag_pattern = re.compile(rb'\[(?:' + b'|'.join(re.escape(tag[1:-1]) for tag in self.tag_dispatch) + rb')\]')
 
-    def parse_log_file(self):
+    def parse_log_file(self, max_workers=None):
         """
         Parse the log file and extract internal BWE engine parameters.
+        Large logs are split into newline-aligned ranges parsed in parallel.
         """
         print(f"[*] Parsing log file: {self.log_file_path}")
         
-        # Separate data collections for each BWE engine
-        trendline_data = []
-        rtt_data = []
-        loss_data = []
-        probe_data = []
-        decision_data = []
-        
-        # New constraint tracking data collections
-        constraint_apply_data = []
-        delay_limit_data = []
-        receiver_limit_data = []
-        config_limit_data = []
-        pushback_data = []
-        
-        # Track the most recent timestamp for lines without explicit timestamps
-        last_timestamp = None
-
-        with open(self.log_file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                # Extract timestamp from any line that has one
-                timestamp_match = re.search(r'Time: (\d+) ms|at (\d+) ms', line)
-                if timestamp_match:
-                    last_timestamp = int(timestamp_match.group(1) or timestamp_match.group(2))
-                    
-                # Match Trendline data (Delay BWE internal)
-                trendline_match = self.patterns['trendline'].search(line)
-                if trendline_match:
-                    timestamp = int(trendline_match.group(1))
-                    modified_trend = trendline_match.group(2)
-                    threshold = trendline_match.group(3)
-                    state = trendline_match.group(4)
-                    
-                    # Handle 'nan' values
-                    try:
-                        modified_trend_val = float(modified_trend) if modified_trend != 'nan' else 0.0
-                    except:
-                        modified_trend_val = 0.0
-                    
-                    try:
-                        threshold_val = float(threshold)
-                    except:
-                        threshold_val = 0.0
-                        
-                    trendline_data.append({
-                        'timestamp': timestamp,
-                        'modified_trend': modified_trend_val,
-                        'threshold': threshold_val,
-                        'state': state
-                    })
-                    continue
-
-                # Match RTT BWE data
-                rtt_match = self.patterns['rtt_bwe'].search(line)
-                if rtt_match:
-                    timestamp = int(rtt_match.group(1))
-                    corrected_rtt = int(rtt_match.group(3))
-                    rtt_limit = int(rtt_match.group(4))
-                    above_limit = rtt_match.group(5) == 'true'
-                    
-                    rtt_data.append({
-                        'timestamp': timestamp,
-                        'corrected_rtt': corrected_rtt,
-                        'rtt_limit': rtt_limit,
-                        'above_limit': above_limit
-                    })
-                    continue
-
-                # Match Loss BWE data
-                loss_match = self.patterns['loss_bwe'].search(line)
-                if loss_match:
-                    timestamp = int(loss_match.group(1))
-                    state = int(loss_match.group(2))
-                    bandwidth = int(loss_match.group(3))
-                    observations = int(loss_match.group(4))
-                    
-                    loss_data.append({
-                        'timestamp': timestamp,
-                        'state': state,
-                        'bandwidth': bandwidth,
-                        'observations': observations
-                    })
-                    continue
-
-                # Match Loss BWE candidates data
-                candidates_match = self.patterns['loss_candidates'].search(line)
-                if candidates_match:
-                    timestamp = int(candidates_match.group(1))
-                    candidates_str = candidates_match.group(2)
-                    # Parse candidate bandwidths (they end with comma and space)
-                    candidates = [float(x.strip().rstrip(',')) for x in candidates_str.split(',') if x.strip().rstrip(',')]
-                    
-                    loss_data.append({
-                        'timestamp': timestamp,
-                        'state': -1,  # Special marker for candidates
-                        'bandwidth': int(max(candidates) * 1000) if candidates else 0,  # Convert back to bps
-                        'observations': len(candidates),
-                        'candidates': candidates
-                    })
-                    continue
-
-                # Match Probe BWE results with explicit timestamps (new format)
-                probe_result_match = self.patterns['probe_result'].search(line)
-                if probe_result_match:
-                    timestamp = int(probe_result_match.group(1))
-                    cluster_id = int(probe_result_match.group(2))
-                    estimate = int(probe_result_match.group(3))
-                    
-                    probe_data.append({
-                        'timestamp': timestamp,
-                        'cluster_id': cluster_id,
-                        'estimate': estimate,
-                        'source': 'result'
-                    })
-                    continue
-
-                # Match Probe BWE success with explicit timestamps (new format)
-                probe_success_match = self.patterns['probe_success'].search(line)
-                if probe_success_match:
-                    timestamp = int(probe_success_match.group(1))
-                    cluster_id = int(probe_success_match.group(2))
-                    estimate = int(probe_success_match.group(3))  # Use send rate as estimate
-                    
-                    probe_data.append({
-                        'timestamp': timestamp,
-                        'cluster_id': cluster_id,
-                        'estimate': estimate,
-                        'source': 'success'
-                    })
-                    continue
-
-                # Fallback: Match old format without explicit timestamps
-                probe_result_old_match = self.patterns['probe_result_old'].search(line)
-                if probe_result_old_match and last_timestamp:
-                    cluster_id = int(probe_result_old_match.group(1))
-                    estimate = int(probe_result_old_match.group(2))
-                    
-                    probe_data.append({
-                        'timestamp': last_timestamp,
-                        'cluster_id': cluster_id,
-                        'estimate': estimate,
-                        'source': 'result_old'
-                    })
-                    continue
-
-                probe_success_old_match = self.patterns['probe_success_old'].search(line)
-                if probe_success_old_match and last_timestamp:
-                    cluster_id = int(probe_success_old_match.group(1))
-                    estimate = int(probe_success_old_match.group(2))
-                    
-                    probe_data.append({
-                        'timestamp': last_timestamp,
-                        'cluster_id': cluster_id,
-                        'estimate': estimate,
-                        'source': 'success_old'
-                    })
-                    continue
-
-                # Match GCC decision snapshots for final decision
-                decision_match = self.patterns['decision'].search(line)
-                if decision_match:
-                    timestamp = int(decision_match.group(1))
-                    decision_reason = decision_match.group(9)
-                    
-                    decision_data.append({
-                        'timestamp': timestamp,
-                        'decision_reason': decision_reason
-                    })
-                    continue
-
-                # Match constraint application logs
-                constraint_match = self.patterns['constraint_apply'].search(line)
-                if constraint_match:
-                    timestamp = int(constraint_match.group(1))
-                    original = int(constraint_match.group(2))
-                    upper_limit = int(constraint_match.group(3))
-                    after_upper = int(constraint_match.group(4))
-                    min_config = int(constraint_match.group(5))
-                    final = int(constraint_match.group(6))
-                    delay_limit = int(constraint_match.group(7))
-                    receiver_limit = int(constraint_match.group(8))
-                    max_config = int(constraint_match.group(9))
-                    
-                    constraint_apply_data.append({
-                        'timestamp': timestamp,
-                        'original': original,
-                        'upper_limit': upper_limit,
-                        'after_upper': after_upper,
-                        'min_config': min_config,
-                        'final': final,
-                        'delay_limit': delay_limit,
-                        'receiver_limit': receiver_limit,
-                        'max_config': max_config
-                    })
-                    continue
-
-                # Match delay limit updates
-                delay_limit_match = self.patterns['delay_limit'].search(line)
-                if delay_limit_match:
-                    timestamp = int(delay_limit_match.group(1))
-                    old_limit = int(delay_limit_match.group(2))
-                    new_limit = int(delay_limit_match.group(3))
-                    current_target = int(delay_limit_match.group(4))
-                    
-                    delay_limit_data.append({
-                        'timestamp': timestamp,
-                        'old_limit': old_limit,
-                        'new_limit': new_limit,
-                        'current_target': current_target
-                    })
-                    continue
-
-                # Match receiver limit updates
-                receiver_limit_match = self.patterns['receiver_limit'].search(line)
-                if receiver_limit_match:
-                    timestamp = int(receiver_limit_match.group(1))
-                    old_limit = int(receiver_limit_match.group(2))
-                    new_limit = int(receiver_limit_match.group(3))
-                    current_target = int(receiver_limit_match.group(4))
-                    
-                    receiver_limit_data.append({
-                        'timestamp': timestamp,
-                        'old_limit': old_limit,
-                        'new_limit': new_limit,
-                        'current_target': current_target
-                    })
-                    continue
-
-                # Match pushback logs
-                pushback_match = self.patterns['pushback'].search(line)
-                if pushback_match:
-                    timestamp = int(pushback_match.group(1))
-                    original_rate = int(pushback_match.group(2))
-                    pushback_rate = int(pushback_match.group(3))
-                    min_bitrate = int(pushback_match.group(4))
-                    reduction = int(pushback_match.group(5))
-                    reduction_ratio = float(pushback_match.group(6))
-                    
-                    pushback_data.append({
-                        'timestamp': timestamp,
-                        'original_rate': original_rate,
-                        'pushback_rate': pushback_rate,
-                        'min_bitrate': min_bitrate,
-                        'reduction': reduction,
-                        'reduction_ratio': reduction_ratio
-                    })
-                    continue
+        # Separate column lists for each BWE engine and constraint type
+        self._columns = self._empty_columns()
+
+        workers = max_workers or os.cpu_count() or 1
+        if workers > 1 and os.path.getsize(self.log_file_path) >= PARALLEL_PARSE_MIN_BYTES:
+            self._parse_parallel(workers)
+        else:
+            with open(self.log_file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                        self._scan_buffer(buf, 0, len(buf))
 
         # Convert to DataFrames
-        trendline_df = pd.DataFrame(trendline_data)
-        rtt_df = pd.DataFrame(rtt_data)
-        loss_df = pd.DataFrame(loss_data)
-        probe_df = pd.DataFrame(probe_data)
-        decision_df = pd.DataFrame(decision_data)
+        trendline_df = self._build_frame('trendline')
+        rtt_df = self._build_frame('rtt')
+        loss_df = self._build_frame('loss')
+        # Only candidate rows carry a candidates array
+        if not loss_df.empty and loss_df['candidates'].isna().all():
+            loss_df = loss_df.drop(columns='candidates')
+        probe_df = self._build_frame('probe')
+        decision_df = self._build_frame('decision')
         
         # Convert new constraint data to DataFrames
-        constraint_apply_df = pd.DataFrame(constraint_apply_data)
-        delay_limit_df = pd.DataFrame(delay_limit_data)
-        receiver_limit_df = pd.DataFrame(receiver_limit_data)
-        config_limit_df = pd.DataFrame(config_limit_data)
-        pushback_df = pd.DataFrame(pushback_data)
+        constraint_apply_df = self._build_frame('constraint_apply')
+        delay_limit_df = self._build_frame('delay_limit')
+        receiver_limit_df = self._build_frame('receiver_limit')
+        config_limit_df = self._build_frame('config_limit')
+        pushback_df = self._build_frame('pushback')
+
+        # Relative time in seconds, computed once for both charts. Log lines carry
+        # different clocks, so each chart keeps its own origin: the metrics chart
+        # starts at the first trendline/RTT/decision sample, the constraint chart
+        # at the first constraint application.
+        self.start_time_ms = self._add_time_s(
+            (trendline_df, rtt_df, decision_df), (loss_df, probe_df))
+        self.constraint_start_time_ms = self._add_time_s(
+            (constraint_apply_df,), (delay_limit_df, receiver_limit_df, config_limit_df, pushback_df))
 
         print(f"[*] Parsing completed:")
         print(f"  Trendline data points: {len(trendline_df)}")
@@ -340,6 +245,304 @@ class GccDecisionAnalyzer:
             'pushback': pushback_df
         }
 
+    @staticmethod
+    def _add_time_s(origin_frames, other_frames):
+        """Add time_s to every non-empty frame, counted from the earliest timestamp in origin_frames."""
+        origin_frames = [df for df in origin_frames if not df.empty]
+        start_time_ms = min(df['timestamp'].min() for df in origin_frames) if origin_frames else 0
+        for df in (*origin_frames, *other_frames):
+            if not df.empty:
+                # float32 keeps ~1 ms resolution over a multi-hour log
+                df['time_s'] = ((df['timestamp'].to_numpy() - start_time_ms) * 1e-3).astype(np.float32)
+        return start_time_ms
+
+    def _empty_columns(self):
+        """Fresh column lists for every table in COLUMNS."""
+        return {name: tuple([] for _ in columns) for name, columns in self.COLUMNS.items()}
+
+    def _parse_parallel(self, workers):
+        """Split the log at newlines, parse the ranges in a process pool and join them in order."""
+        with open(self.log_file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                size = len(buf)
+                edges = [0]
+                for i in range(1, workers):
+                    edges.append((buf.find(b'\n', max(size * i // workers, edges[-1])) + 1) or size)
+                edges.append(size)
+        chunks = [(start, end) for start, end in zip(edges, edges[1:]) if start < end]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_parse_log_chunk, *zip(*[
+                (self.log_file_path, start, end) for start, end in chunks
+            ]))
+            for chunk_columns in results:
+                for name, columns in chunk_columns.items():
+                    for column, values in zip(self._columns[name], columns):
+                        column.extend(values)
+
+    def _scan_buffer(self, buf, start, end):
+        """
+        Find each tagged entry in buf[start:end] and hand its line to the matching
+        handler. Lines stay bytes: the patterns are bytes regexes and only the few
+        text fields kept in the tables are decoded.
+        """
+        self._buf = buf
+        # Most recent timestamp for lines without explicit timestamps, resolved
+        # lazily from the text scanned so far (see _timestamp_before)
+        self._last_timestamp = None
+        self._ts_scan_pos = start
+        self._ts_prefix_end = start
+        search = self.tag_pattern.search
+        tag_dispatch = self.tag_dispatch
+        pos = start
+        while True:
+            tag_match = search(buf, pos, end)
+            if tag_match is None:
+                break
+            tag_start = tag_match.start()
+            line_end = buf.find(b'\n', tag_start, end)
+            if line_end < 0:
+                line_end = end
+            line = buf[tag_start:line_end]
+            for parse, handler in tag_dispatch[tag_match.group()]:
+                fields = parse(line)
+                if fields:
+                    self._line_end = line_end
+                    handler(fields)
+                    pos = line_end
+                    break
+            else:
+                # Unrecognised layout: a later tag on the same line may still match
+                pos = tag_match.end()
+        self._buf = None
+
+    def _build_frame(self, name):
+        """
+        Build one parsed table from its column lists. Integer columns are stored
+        as int32 when their range allows; timestamps stay int64 because sender-side
+        clocks exceed the int32 range. Float columns stay float64 since the summary
+        statistics compare them (e.g. trend vs. threshold); only the arrays handed
+        to Matplotlib are narrowed.
+        """
+        values = self._columns[name]
+        if not values[0]:
+            return _EMPTY_FRAME
+        frame = {}
+        for column, column_values in zip(self.COLUMNS[name], values):
+            kind = type(column_values[0])
+            if column == 'timestamp' or column == 'candidates':
+                frame[column] = column_values
+            elif kind is int:
+                array = np.array(column_values, dtype=np.int64)
+                if array.min() >= _INT32.min and array.max() <= _INT32.max:
+                    array = array.astype(np.int32)
+                frame[column] = array
+            elif kind is float:
+                frame[column] = np.array(column_values, dtype=np.float64)
+            else:
+                frame[column] = column_values
+        return pd.DataFrame(frame)
+
+    def _on_trendline(self, match):
+        """Match Trendline data (Delay BWE internal)"""
+        timestamps, trends, thresholds, states = self._columns['trendline']
+        modified_trend = match.group(2)
+        threshold = match.group(3)
+        
+        # Handle 'nan' values
+        try:
+            modified_trend_val = float(modified_trend) if modified_trend != b'nan' else 0.0
+        except:
+            modified_trend_val = 0.0
+        
+        try:
+            threshold_val = float(threshold)
+        except:
+            threshold_val = 0.0
+            
+        timestamps.append(int(match.group(1)))
+        trends.append(modified_trend_val)
+        thresholds.append(threshold_val)
+        states.append(match.group(4).decode('ascii'))
+
+    def _on_rtt_bwe(self, match):
+        """Match RTT BWE data"""
+        timestamps, corrected_rtts, rtt_limits, above_limits = self._columns['rtt']
+        timestamps.append(int(match.group(1)))
+        corrected_rtts.append(int(match.group(3)))
+        rtt_limits.append(int(match.group(4)))
+        above_limits.append(match.group(5) == b'true')
+
+    def _on_loss_bwe(self, match):
+        """Match Loss BWE data"""
+        self._on_int_columns('loss', match)
+        self._columns['loss'][4].append(float('nan'))  # candidates
+
+    def _on_loss_candidates(self, match):
+        """Match Loss BWE candidates data"""
+        timestamps, states, bandwidths, observations, candidate_lists = self._columns['loss']
+        # Parse candidate bandwidths (they end with comma and space); empty fields are skipped
+        candidates = np.array([float(field) for field in match.group(2).split(b',') if field.strip()])
+        
+        timestamps.append(int(match.group(1)))
+        states.append(-1)  # Special marker for candidates
+        bandwidths.append(int(candidates.max() * 1000) if candidates.size else 0)  # Convert back to bps
+        observations.append(candidates.size)
+        candidate_lists.append(candidates)
+
+    def _timestamp_before(self, offset):
+        """
+        Return the timestamp of the last line ending before offset that has one.
+        Only the text after the previous lookup is scanned, so the whole log is
+        searched at most once no matter how many old-format entries it contains.
+        """
+        buf = self._buf
+        last = None
+        for last in _TS_RE.finditer(buf, self._ts_scan_pos, offset):
+            pass
+        if last is not None:
+            # A line may hold several stamps; the first one in the line wins
+            line_start = buf.rfind(b'\n', 0, last.start()) + 1
+            first = _TS_RE.search(buf, line_start)
+            self._last_timestamp = int(first.group(1) or first.group(2))
+        elif self._last_timestamp is None and self._ts_prefix_end:
+            # Nothing stamped yet in this range: take the last stamp before it
+            self._last_timestamp = self._last_timestamp_before_range()
+        self._ts_prefix_end = 0
+        self._ts_scan_pos = offset
+        return self._last_timestamp
+
+    def _last_timestamp_before_range(self):
+        """Walk back line by line from the start of a parallel range to the nearest stamped line."""
+        buf = self._buf
+        line_end = self._ts_prefix_end
+        while line_end > 0:
+            line_start = buf.rfind(b'\n', 0, line_end - 1) + 1
+            match = _TS_RE.search(buf, line_start, line_end)
+            if match:
+                return int(match.group(1) or match.group(2))
+            line_end = line_start
+        return None
+
+    def _append_probe(self, timestamp, cluster_id, estimate, source):
+        """Append one probe estimate (result or success, any format)."""
+        timestamps, cluster_ids, estimates, sources = self._columns['probe']
+        timestamps.append(timestamp)
+        cluster_ids.append(cluster_id)
+        estimates.append(estimate)
+        sources.append(source)
+
+    def _on_probe_result(self, match):
+        """Match Probe BWE results with explicit timestamps (new format)"""
+        self._append_probe(*map(int, match.groups()), 'result')
+
+    def _on_probe_success(self, match):
+        """Match Probe BWE success with explicit timestamps (new format)"""
+        # Use send rate as estimate
+        self._append_probe(*map(int, match.groups()), 'success')
+
+    def _on_probe_result_old(self, match):
+        """Fallback: Match old format without explicit timestamps"""
+        timestamp = self._timestamp_before(self._line_end)
+        if timestamp:
+            self._append_probe(timestamp, int(match.group(1)), int(match.group(2)), 'result_old')
+
+    def _on_probe_success_old(self, match):
+        """Fallback: Match old format without explicit timestamps"""
+        timestamp = self._timestamp_before(self._line_end)
+        if timestamp:
+            self._append_probe(timestamp, int(match.group(1)), int(match.group(2)), 'success_old')
+
+    @staticmethod
+    def _split_decision(line):
+        """
+        Split a GCC decision snapshot on its ' | ' separators instead of running
+        the 10-group 'decision' pattern; only the time and reason are kept.
+        """
+        parts = line.split(b' | ')
+        if len(parts) < 9 or not parts[7].startswith(b'DecisionReason: ') or not parts[8].startswith(b'Updated: '):
+            return None
+        # parts[0] is b'[GCC-DECISION-SNAPSHOT] at <ms>ms'
+        timestamp = parts[0][27:-2]
+        if not parts[0].startswith(b' at ', 23) or not parts[0].endswith(b'ms') or not timestamp.isdigit():
+            return None
+        return int(timestamp), parts[7][16:].decode('ascii', 'replace')
+
+    def _on_decision(self, fields):
+        """Match GCC decision snapshots for final decision"""
+        timestamps, decision_reasons = self._columns['decision']
+        timestamps.append(fields[0])
+        decision_reasons.append(fields[1])
+
+    def _on_int_columns(self, name, match):
+        """Append the integer groups of match to table name, one group per column."""
+        for column, value in zip(self._columns[name], map(int, match.groups())):
+            column.append(value)
+
+    def _on_constraint_apply(self, match):
+        """Match constraint application logs"""
+        self._on_int_columns('constraint_apply', match)
+
+    def _on_delay_limit(self, match):
+        """Match delay limit updates"""
+        self._on_int_columns('delay_limit', match)
+
+    def _on_receiver_limit(self, match):
+        """Match receiver limit updates"""
+        self._on_int_columns('receiver_limit', match)
+
+    def _on_pushback(self, match):
+        """Match pushback logs"""
+        # Five integer fields followed by the reduction ratio percentage
+        groups = match.groups()
+        columns = self._columns['pushback']
+        for column, value in zip(columns, map(int, groups[:5])):
+            column.append(value)
+        columns[5].append(float(groups[5]))
+
+    @staticmethod
+    def _metrics_layout_of(trendline_df, rtt_df, loss_df, probe_df, decision_df):
+        """Which plotting branches the metrics figure takes for this data."""
+        has_estimates = not loss_df.empty and bool((loss_df['state'] >= 0).any())
+        if probe_df.empty:
+            probe = None
+        else:
+            timed = int(probe_df['timestamp'].notna().sum())
+            probe = ('time', timed > 1) if timed else ('index',)
+        return (not trendline_df.empty, not rtt_df.empty, has_estimates, probe,
+                not decision_df.empty)
+
+    def _line(self, key, ax, x, y, *args, **kwargs):
+        """Plot a line on the first draw; afterwards just swap in the new data."""
+        line = self._artists.get(key)
+        if line is None:
+            line, = ax.plot(x, y, *args, **kwargs)
+            self._artists[key] = line
+        else:
+            line.set_data(x, y)
+            if 'marker' in kwargs:
+                line.set_marker(kwargs['marker'])
+            ax.relim()
+            ax.autoscale_view()
+        return line
+
+    def _transient(self, artist):
+        """Track an artist that is removed and redrawn on every call."""
+        self._metrics_transient.append(artist)
+        return artist
+
+    def close_figure(self, fig):
+        """Close a figure returned by the plot methods and drop the cached artists that keep it alive."""
+        plt.close(fig)
+        if fig is self._metrics_fig:
+            self._metrics_fig = None
+            self._artists = {}
+            self._metrics_axes = None
+            self._metrics_layout = None
+            self._metrics_transient = []
+        elif fig is self._constraint_fig:
+            self._constraint_fig = None
+
     def plot_gcc_decision_metrics(self, data_dict):
         """
         Plot GCC internal parameters comparison using 5 vertical subplots.
@@ -354,50 +557,60 @@ class GccDecisionAnalyzer:
             print("[!] Insufficient data to generate charts.")
             return None
         
-        # Set matplotlib style
-        try:
-            plt.style.use('seaborn-v0_8-whitegrid')
-        except:
-            plt.style.use('default')
-            
-        # Create 5 vertical subplots
-        fig, axes = plt.subplots(5, 1, figsize=(16, 20), sharex=True)
+        # Create 5 vertical subplots. A previous figure with the same layout keeps
+        # its line artists (updated via set_data); fills and texts are redrawn.
+        layout = self._metrics_layout_of(trendline_df, rtt_df, loss_df, probe_df, decision_df)
+        if self._metrics_fig is None:
+            self._metrics_fig = plt.figure(figsize=(16, 20))
+        fig = self._metrics_fig
+        if self._metrics_axes is not None and layout == self._metrics_layout:
+            axes = self._metrics_axes
+            for artist in self._metrics_transient:
+                artist.remove()
+            self._metrics_transient = []
+            for ax in (*axes, self._artists.get('loss_twin')):
+                if ax is not None:
+                    ax.relim()
+                    ax.set_autoscale_on(True)
+        else:
+            fig.clear()
+            axes = fig.subplots(5, 1, sharex=True)
+            self._artists = {}
+            self._metrics_axes = axes
+            self._metrics_layout = layout
+            self._metrics_transient = []
         fig.suptitle(f'WebRTC GCC Internal Parameters Analysis\n({self.log_file_path})', 
                      fontsize=16, fontweight='bold')
 
-        # Determine common time range
-        all_timestamps = []
-        if not trendline_df.empty:
-            all_timestamps.extend(trendline_df['timestamp'].tolist())
-        if not rtt_df.empty:
-            all_timestamps.extend(rtt_df['timestamp'].tolist())
-        if not decision_df.empty:
-            all_timestamps.extend(decision_df['timestamp'].tolist())
-            
-        if all_timestamps:
-            start_time_ms = min(all_timestamps)
-            end_time_ms = max(all_timestamps)
-            time_limit = (end_time_ms - start_time_ms) / 1000.0 + 1.0
+        # Determine common time range (time_s was computed by parse_log_file)
+        timed = [df for df in (trendline_df, rtt_df, decision_df) if not df.empty]
+        if timed:
+            start_time_ms = min(df['timestamp'].min() for df in timed)
+            end_time_ms = max(df['timestamp'].max() for df in timed)
+            time_limit = max(df['time_s'].max() for df in timed) + 1.0
             print(f"[*] Chart will display time range: 0 - {time_limit:.1f} seconds")
             print(f"[*] Timestamps: {start_time_ms} - {end_time_ms}")
         else:
-            start_time_ms = 0
             time_limit = 10.0
 
         # 1. Delay BWE Internal: Modified Trend vs Threshold
         if not trendline_df.empty:
-            trendline_df['time_s'] = (trendline_df['timestamp'] - start_time_ms) / 1000.0
+            time_s = trendline_df['time_s'].to_numpy()
+            trend = trendline_df['modified_trend'].to_numpy()
+            threshold = trendline_df['threshold'].to_numpy()
+            overusing = trend > threshold
+            rows = _plot_rows(trend, threshold)
             
-            axes[0].plot(trendline_df['time_s'], trendline_df['modified_trend'], 'o-', 
-                        color='blue', label='Modified Trend', markersize=3, linewidth=2)
-            axes[0].plot(trendline_df['time_s'], trendline_df['threshold'], '-', 
-                        color='red', label='Threshold', linewidth=2, alpha=0.8)
+            self._line('trendline_trend', axes[0], time_s[rows], trend[rows], '-', 
+                       marker=_line_marker(len(trendline_df)), color='blue', label='Modified Trend', markersize=3, linewidth=2)
+            self._line('trendline_threshold', axes[0], time_s[rows], threshold[rows], '-', 
+                       color='red', label='Threshold', linewidth=2, alpha=0.8)
             
             # Fill area between trend and threshold when trend > threshold (overusing)
-            axes[0].fill_between(trendline_df['time_s'], trendline_df['modified_trend'], 
-                               trendline_df['threshold'], 
-                               where=(trendline_df['modified_trend'] > trendline_df['threshold']),
-                               color='red', alpha=0.3, label='Overusing Region')
+            self._transient(axes[0].fill_between(time_s[rows], trend[rows], 
+                               threshold[rows], 
+                               where=overusing[rows],
+                               color='red', alpha=0.3, label='Overusing Region'))
             
             axes[0].set_ylabel('Trend/Threshold', fontsize=11)
             axes[0].set_title('1. Delay BWE: Modified Trend vs Threshold (Internal Decision)', 
@@ -405,27 +618,31 @@ class GccDecisionAnalyzer:
             axes[0].grid(True, alpha=0.3)
             
             # Add statistics
-            overusing_count = (trendline_df['modified_trend'] > trendline_df['threshold']).sum()
+            overusing_count = np.count_nonzero(overusing)
             total_count = len(trendline_df)
-            axes[0].text(0.02, 0.95, f'Overusing: {overusing_count}/{total_count} points ({overusing_count/total_count*100:.1f}%)', 
+            self._transient(axes[0].text(0.02, 0.95, f'Overusing: {overusing_count}/{total_count} points ({overusing_count/total_count*100:.1f}%)', 
                         transform=axes[0].transAxes, 
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.5), fontsize=9)
+                        bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.5), fontsize=9))
             axes[0].legend(fontsize=10)
 
         # 2. RTT BWE Internal: CorrectedRtt vs RttLimit
         if not rtt_df.empty:
-            rtt_df['time_s'] = (rtt_df['timestamp'] - start_time_ms) / 1000.0
+            time_s = rtt_df['time_s'].to_numpy()
+            corrected_rtt = rtt_df['corrected_rtt'].to_numpy()
+            rtt_limit = rtt_df['rtt_limit'].to_numpy()
+            backoff = corrected_rtt > rtt_limit
+            rows = _plot_rows(corrected_rtt)
             
-            axes[1].plot(rtt_df['time_s'], rtt_df['corrected_rtt'], 'o-', 
-                        color='green', label='CorrectedRtt (ms)', markersize=3, linewidth=2)
-            axes[1].axhline(rtt_df['rtt_limit'].iloc[0], color='red', linestyle='--', 
-                           linewidth=2, label=f'RTT Limit ({rtt_df["rtt_limit"].iloc[0]} ms)')
+            self._line('rtt_corrected', axes[1], time_s[rows], corrected_rtt[rows], '-', 
+                       marker=_line_marker(len(rtt_df)), color='green', label='CorrectedRtt (ms)', markersize=3, linewidth=2)
+            self._transient(axes[1].axhline(rtt_df['rtt_limit'].iloc[0], color='red', linestyle='--', 
+                           linewidth=2, label=f'RTT Limit ({rtt_df["rtt_limit"].iloc[0]} ms)'))
             
             # Fill area when RTT > limit (backoff region)
-            axes[1].fill_between(rtt_df['time_s'], rtt_df['corrected_rtt'], 
-                               rtt_df['rtt_limit'],
-                               where=(rtt_df['corrected_rtt'] > rtt_df['rtt_limit']),
-                               color='red', alpha=0.3, label='Backoff Region')
+            self._transient(axes[1].fill_between(time_s[rows], corrected_rtt[rows], 
+                               rtt_limit[rows],
+                               where=backoff[rows],
+                               color='red', alpha=0.3, label='Backoff Region'))
             
             axes[1].set_ylabel('RTT (ms)', fontsize=11)
             axes[1].set_title('2. RTT BWE: CorrectedRtt vs Limit (Internal Decision)', 
@@ -439,12 +656,12 @@ class GccDecisionAnalyzer:
             axes[1].grid(True, alpha=0.3)
             
             # Add statistics
-            backoff_count = (rtt_df['corrected_rtt'] > rtt_df['rtt_limit']).sum()
+            backoff_count = np.count_nonzero(backoff)
             total_count = len(rtt_df)
             avg_rtt = rtt_df['corrected_rtt'].mean()
-            axes[1].text(0.02, 0.95, f'Backoff: {backoff_count}/{total_count} points, Avg RTT: {avg_rtt:.1f}ms', 
+            self._transient(axes[1].text(0.02, 0.95, f'Backoff: {backoff_count}/{total_count} points, Avg RTT: {avg_rtt:.1f}ms', 
                         transform=axes[1].transAxes, 
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgreen", alpha=0.5), fontsize=9)
+                        bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgreen", alpha=0.5), fontsize=9))
             axes[1].legend(fontsize=10)
 
         # 3. Loss BWE Internal: State, Bandwidth, Observations
@@ -455,18 +672,22 @@ class GccDecisionAnalyzer:
             
             if not estimates_df.empty:
                 # Convert timestamps to relative time
-                estimates_df = estimates_df.copy()
-                estimates_df['time_s'] = (estimates_df['timestamp'] - start_time_ms) / 1000.0
+                time_s = estimates_df['time_s'].to_numpy()
+                bandwidth_kbps = estimates_df['bandwidth'].to_numpy(dtype=np.float32) * np.float32(1e-3)
+                state = estimates_df['state'].to_numpy()
+                rows = _plot_rows(bandwidth_kbps, state)
                 
                 # Primary axis for bandwidth (line plot)
-                axes[2].plot(estimates_df['time_s'], estimates_df['bandwidth']/1000, 
-                            'o-', color='purple', label='Bandwidth (kbps)', 
-                            markersize=4, linewidth=2, alpha=0.8)
+                self._line('loss_bandwidth', axes[2], time_s[rows], bandwidth_kbps[rows], '-', 
+                           marker=_line_marker(len(estimates_df)), color='purple', label='Bandwidth (kbps)', 
+                           markersize=4, linewidth=2, alpha=0.8)
                 
                 # Secondary axis for state
-                ax2_twin = axes[2].twinx()
-                ax2_twin.plot(estimates_df['time_s'], estimates_df['state'], 'o-', color='red', 
-                             label='State', markersize=4, linewidth=2)
+                ax2_twin = self._artists.get('loss_twin')
+                if ax2_twin is None:
+                    ax2_twin = self._artists['loss_twin'] = axes[2].twinx()
+                self._line('loss_state', ax2_twin, time_s[rows], state[rows], '-', 
+                           marker=_line_marker(len(estimates_df)), color='red', label='State', markersize=4, linewidth=2)
                 ax2_twin.set_ylabel('State', fontsize=11, color='red')
                 ax2_twin.tick_params(axis='y', labelcolor='red')
                 
@@ -475,11 +696,11 @@ class GccDecisionAnalyzer:
                 ax2_twin.set_yticks([0, 1, 2, 3])
                 ax2_twin.set_yticklabels(['Increasing', 'IncPadding', 'Decreasing', 'DelayBased'], fontsize=9)
                 
-                # Add observations as text annotations
-                for i, (time, obs) in enumerate(zip(estimates_df['time_s'], estimates_df['observations'])):
-                    if i % max(1, len(estimates_df)//10) == 0:  # Show every 10th annotation
-                        ax2_twin.text(time, estimates_df['state'].iloc[i] + 0.1, f'{obs}', 
-                                     fontsize=8, ha='center', alpha=0.7)
+                # Add observations as text annotations (about 10 evenly spaced)
+                observations = estimates_df['observations'].to_numpy()
+                for i in np.arange(0, len(estimates_df), max(1, len(estimates_df)//10)):
+                    self._transient(ax2_twin.text(time_s[i], state[i] + 0.1, f'{observations[i]}', 
+                                 fontsize=8, ha='center', alpha=0.7))
                 
                 axes[2].set_ylabel('Bandwidth (kbps)', fontsize=11)
                 axes[2].set_title('3. Loss BWE: State, Bandwidth & Observations (Time-aligned)', 
@@ -496,9 +717,9 @@ class GccDecisionAnalyzer:
                 state_names = {0: 'Increasing', 1: 'IncPadding', 2: 'Decreasing', 3: 'DelayBased'}
                 state_name = state_names.get(most_common_state, f'Unknown({most_common_state})')
                 
-                axes[2].text(0.02, 0.95, f'Avg BW: {avg_bandwidth:.0f}kbps, Obs: {avg_observations:.1f}, State: {state_name}', 
+                self._transient(axes[2].text(0.02, 0.95, f'Avg BW: {avg_bandwidth:.0f}kbps, Obs: {avg_observations:.1f}, State: {state_name}', 
                             transform=axes[2].transAxes, 
-                            bbox=dict(boxstyle="round,pad=0.3", facecolor="plum", alpha=0.5), fontsize=9)
+                            bbox=dict(boxstyle="round,pad=0.3", facecolor="plum", alpha=0.5), fontsize=9))
                 axes[2].legend(fontsize=10)
 
         # 4. Probe BWE Results
@@ -510,18 +731,17 @@ class GccDecisionAnalyzer:
                 # Filter out entries without timestamps
                 probe_with_time = probe_df.dropna(subset=['timestamp'])
                 if not probe_with_time.empty:
-                    probe_with_time = probe_with_time.copy()
-                    probe_with_time['time_s'] = (probe_with_time['timestamp'] - start_time_ms) / 1000.0
+                    time_s = probe_with_time['time_s'].to_numpy()
                     
                     # Create scatter plot with time alignment
-                    axes[3].scatter(probe_with_time['time_s'], probe_with_time['estimate']/1000, 
+                    self._transient(axes[3].scatter(time_s, probe_with_time['estimate']/1000, 
                                    c=probe_with_time['cluster_id'], cmap='viridis', 
-                                   s=60, alpha=0.8, label='Probe Estimates', edgecolors='black')
+                                   s=60, alpha=0.8, label='Probe Estimates', edgecolors='black'))
                     
                     # Add trend line if there are enough points
                     if len(probe_with_time) > 1:
-                        axes[3].plot(probe_with_time['time_s'], probe_with_time['estimate']/1000, 
-                                    '--', color='gray', alpha=0.5, linewidth=1)
+                        self._line('probe_trend', axes[3], time_s, probe_with_time['estimate']/1000, 
+                                   '--', color='gray', alpha=0.5, linewidth=1)
                     
                     axes[3].set_ylabel('Bandwidth (kbps)', fontsize=11)
                     axes[3].set_title('4. Probe BWE: Bandwidth Estimates by Cluster (Time-aligned)', 
@@ -532,23 +752,23 @@ class GccDecisionAnalyzer:
                     # Add statistics
                     avg_estimate = probe_with_time['estimate'].mean() / 1000
                     cluster_count = probe_with_time['cluster_id'].nunique()
-                    axes[3].text(0.02, 0.95, f'Avg Estimate: {avg_estimate:.0f}kbps, Clusters: {cluster_count}, Points: {len(probe_with_time)}', 
+                    self._transient(axes[3].text(0.02, 0.95, f'Avg Estimate: {avg_estimate:.0f}kbps, Clusters: {cluster_count}, Points: {len(probe_with_time)}', 
                                 transform=axes[3].transAxes, 
-                                bbox=dict(boxstyle="round,pad=0.3", facecolor="lightcyan", alpha=0.5), fontsize=9)
+                                bbox=dict(boxstyle="round,pad=0.3", facecolor="lightcyan", alpha=0.5), fontsize=9))
                     axes[3].legend(fontsize=10)
                 else:
                     # Show message if no timestamps available
-                    axes[3].text(0.5, 0.5, 'No Probe Data with Timestamps', 
+                    self._transient(axes[3].text(0.5, 0.5, 'No Probe Data with Timestamps', 
                                 transform=axes[3].transAxes, ha='center', va='center',
-                                fontsize=14, alpha=0.5)
+                                fontsize=14, alpha=0.5))
                     axes[3].set_title('4. Probe BWE: Bandwidth Estimates by Cluster', 
                                      fontsize=12, fontweight='bold')
                     axes[3].grid(True, alpha=0.3)
             else:
                 # Fallback to index-based plotting if no timestamps
-                axes[3].scatter(range(len(probe_df)), probe_df['estimate']/1000, 
+                self._transient(axes[3].scatter(range(len(probe_df)), probe_df['estimate']/1000, 
                                c=probe_df['cluster_id'], cmap='viridis', 
-                               s=50, alpha=0.7, label='Probe Estimates')
+                               s=50, alpha=0.7, label='Probe Estimates'))
                 
                 axes[3].set_ylabel('Bandwidth (kbps)', fontsize=11)
                 axes[3].set_title('4. Probe BWE: Bandwidth Estimates by Cluster (Index-based)', 
@@ -559,38 +779,41 @@ class GccDecisionAnalyzer:
                 # Add statistics
                 avg_estimate = probe_df['estimate'].mean() / 1000
                 cluster_count = probe_df['cluster_id'].nunique()
-                axes[3].text(0.02, 0.95, f'Avg Estimate: {avg_estimate:.0f}kbps, Clusters: {cluster_count}', 
+                self._transient(axes[3].text(0.02, 0.95, f'Avg Estimate: {avg_estimate:.0f}kbps, Clusters: {cluster_count}', 
                             transform=axes[3].transAxes, 
-                            bbox=dict(boxstyle="round,pad=0.3", facecolor="lightcyan", alpha=0.5), fontsize=9)
+                            bbox=dict(boxstyle="round,pad=0.3", facecolor="lightcyan", alpha=0.5), fontsize=9))
                 axes[3].legend(fontsize=10)
         else:
             # Show empty plot with message
-            axes[3].text(0.5, 0.5, 'No Probe Data Available', 
+            self._transient(axes[3].text(0.5, 0.5, 'No Probe Data Available', 
                         transform=axes[3].transAxes, ha='center', va='center',
-                        fontsize=14, alpha=0.5)
+                        fontsize=14, alpha=0.5))
             axes[3].set_title('4. Probe BWE: Bandwidth Estimates by Cluster', 
                              fontsize=12, fontweight='bold')
             axes[3].grid(True, alpha=0.3)
 
         # 5. Final Decision Reasons
         if not decision_df.empty:
-            decision_df['time_s'] = (decision_df['timestamp'] - start_time_ms) / 1000.0
-            
-            # Convert decision reasons to numeric for plotting
-            reason_map = {
-                'Hold': 0,           # Default state (lowest priority)
-                'LossEstimate': 1,   # 4th priority: Loss-based BWE
-                'ProbeResult': 2,    # 3rd priority: Probe results  
-                'RttBackoff': 3,     # 2nd priority: RTT backoff
-                'DelayLimit': 4      # 1st priority: Delay overuse (highest)
-            }
-            decision_df['decision_numeric'] = decision_df['decision_reason'].map(reason_map).fillna(0)
+            # Convert decision reasons to numeric for plotting: the position in
+            # decision_reasons is the plot level, unknown reasons (-1) fall back to Hold
+            decision_reasons = [
+                'Hold',           # 0: Default state (lowest priority)
+                'LossEstimate',   # 1: 4th priority: Loss-based BWE
+                'ProbeResult',    # 2: 3rd priority: Probe results
+                'RttBackoff',     # 3: 2nd priority: RTT backoff
+                'DelayLimit'      # 4: 1st priority: Delay overuse (highest)
+            ]
+            codes = pd.Index(decision_reasons).get_indexer(decision_df['decision_reason'])
+            decision_df['decision_numeric'] = np.maximum(codes, 0).astype(np.int8)
+            time_s = decision_df['time_s'].to_numpy()
+            decision_numeric = decision_df['decision_numeric'].to_numpy()
+            rows = _plot_rows(decision_numeric)
             
             # Create stepped plot for decision changes
-            axes[4].step(decision_df['time_s'], decision_df['decision_numeric'], where='post', 
-                         color='darkblue', linewidth=3, label='Final Decision')
-            axes[4].fill_between(decision_df['time_s'], decision_df['decision_numeric'], alpha=0.3, 
-                                 color='lightsteelblue', step='post')
+            self._line('decision', axes[4], time_s[rows], decision_numeric[rows], 
+                       drawstyle='steps-post', color='darkblue', linewidth=3, label='Final Decision')
+            self._transient(axes[4].fill_between(time_s[rows], decision_numeric[rows], alpha=0.3, 
+                                 color='lightsteelblue', step='post'))
             axes[4].set_ylabel('Decision Type', fontsize=11)
             axes[4].set_title('5. Final GCC Decision (Priority: DelayLimit > RTT > Probe > Loss)', 
                              fontsize=12, fontweight='bold')
@@ -599,21 +822,31 @@ class GccDecisionAnalyzer:
             axes[4].grid(True, alpha=0.3)
             
             # Add decision statistics
-            decision_counts = decision_df['decision_reason'].value_counts()
-            decision_text = ', '.join([f'{reason}: {count}' for reason, count in decision_counts.items()])
-            axes[4].text(0.02, 0.95, f'Decisions: {decision_text}', transform=axes[4].transAxes, 
-                         bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgreen", alpha=0.5), fontsize=9)
+            # Known reasons are counted on the codes, unknown ones by value. All of them
+            # are then ordered like value_counts(): most frequent first, ties by first appearance
+            counts = np.bincount(codes[codes >= 0], minlength=len(decision_reasons))
+            seen_codes, first_seen = np.unique(codes, return_index=True)
+            decision_counts = [(first, decision_reasons[code], counts[code])
+                               for code, first in zip(seen_codes, first_seen) if code >= 0]
+            unknown_rows = np.flatnonzero(codes < 0)
+            if unknown_rows.size:
+                unknown = pd.Series(decision_df['decision_reason'].to_numpy()[unknown_rows], index=unknown_rows)
+                unknown_counts = unknown.value_counts()
+                decision_counts.extend((first, reason, unknown_counts[reason])
+                                       for first, reason in unknown.drop_duplicates().items())
+            decision_counts.sort(key=lambda entry: (-entry[2], entry[0]))
+            decision_text = ', '.join([f'{reason}: {count}' for _, reason, count in decision_counts])
+            self._transient(axes[4].text(0.02, 0.95, f'Decisions: {decision_text}', transform=axes[4].transAxes, 
+                         bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgreen", alpha=0.5), fontsize=9))
             axes[4].legend(fontsize=10)
 
         # Set x-axis label only for the bottom subplot
         axes[4].set_xlabel('Time (seconds)', fontsize=12)
         
-        # Set x-axis range for all subplots
-        for ax in axes:
-            ax.set_xlim(0, time_limit)
+        # Set x-axis range for all subplots (sharex propagates it from the first)
+        axes[0].set_xlim(0, time_limit)
         
-        plt.tight_layout(rect=[0, 0, 1, 0.96])
-        plt.show()
+        fig.tight_layout(rect=[0, 0, 1, 0.96])
         
         return fig
 
@@ -630,117 +863,104 @@ class GccDecisionAnalyzer:
             print("[!] No constraint application data found.")
             return None
         
-        # Set matplotlib style
-        try:
-            plt.style.use('seaborn-v0_8-whitegrid')
-        except:
-            plt.style.use('default')
-            
-        # Create 6 vertical subplots for constraint analysis
-        fig, axes = plt.subplots(6, 1, figsize=(16, 24), sharex=True)
-        fig.suptitle(f'WebRTC GCC Constraint Analysis - 5-Layer Bandwidth Limitation\n({self.log_file_path})', 
-                     fontsize=16, fontweight='bold')
-
         # Determine common time range
         if not constraint_df.empty:
-            start_time_ms = constraint_df['timestamp'].min()
-            end_time_ms = constraint_df['timestamp'].max()
-            time_limit = (end_time_ms - start_time_ms) / 1000.0 + 1.0
-            constraint_df['time_s'] = (constraint_df['timestamp'] - start_time_ms) / 1000.0
+            time_s = constraint_df['time_s'].to_numpy()
+            time_limit = time_s.max() + 1.0
+            # Bandwidth columns in kbps (float32 is ample for plotting), converted
+            # once and shared by the subplots
+            kbps = {column: constraint_df[column].to_numpy(dtype=np.float32) * np.float32(1e-3)
+                    for column in ('original', 'final', 'delay_limit', 'receiver_limit',
+                                   'upper_limit', 'max_config', 'min_config')}
+            # All constraint subplots share one row selection so lines and fills stay aligned
+            rows = _plot_rows(*kbps.values())
+            time_s = time_s[rows]
+            kbps = {column: values[rows] for column, values in kbps.items()}
         else:
             return None
 
-        # 1. Original LossBasedBwe Estimate
-        axes[0].plot(constraint_df['time_s'], constraint_df['original']/1000, 'o-', 
-                    color='green', label='LossBasedBwe Original', markersize=3, linewidth=2)
-        axes[0].set_ylabel('Bandwidth (kbps)', fontsize=11)
-        axes[0].set_title('1. Original LossBasedBwe Estimate (Before Constraints)', 
-                         fontsize=12, fontweight='bold')
-        axes[0].grid(True, alpha=0.3)
-        axes[0].legend(fontsize=10)
-
-        # 2. DelayBased Constraint
-        axes[1].plot(constraint_df['time_s'], constraint_df['delay_limit']/1000, 'o-', 
-                    color='red', label='DelayBased Limit', markersize=3, linewidth=2)
-        axes[1].plot(constraint_df['time_s'], constraint_df['original']/1000, '--', 
-                    color='green', label='Original Estimate', alpha=0.7, linewidth=1)
-        axes[1].fill_between(constraint_df['time_s'], constraint_df['delay_limit']/1000, 
-                           constraint_df['original']/1000,
-                           where=(constraint_df['delay_limit'] < constraint_df['original']),
-                           color='red', alpha=0.3, label='DelayBased Constraint')
-        axes[1].set_ylabel('Bandwidth (kbps)', fontsize=11)
-        axes[1].set_title('2. DelayBased Constraint Application (Highest Priority)', 
-                         fontsize=12, fontweight='bold')
-        axes[1].grid(True, alpha=0.3)
-        axes[1].legend(fontsize=10)
-
-        # 3. Receiver Limit Constraint
-        axes[2].plot(constraint_df['time_s'], constraint_df['receiver_limit']/1000, 'o-', 
-                    color='orange', label='Receiver Limit', markersize=3, linewidth=2)
-        axes[2].plot(constraint_df['time_s'], constraint_df['upper_limit']/1000, '--', 
-                    color='purple', label='Combined Upper Limit', alpha=0.7, linewidth=1)
-        axes[2].set_ylabel('Bandwidth (kbps)', fontsize=11)
-        axes[2].set_title('3. Receiver Limit Constraint', 
-                         fontsize=12, fontweight='bold')
-        axes[2].grid(True, alpha=0.3)
-        axes[2].legend(fontsize=10)
-
-        # 4. Config Limits (Min/Max)
-        axes[3].plot(constraint_df['time_s'], constraint_df['max_config']/1000, 'o-', 
-                    color='blue', label='Max Config Limit', markersize=3, linewidth=2)
-        axes[3].plot(constraint_df['time_s'], constraint_df['min_config']/1000, 'o-', 
-                    color='cyan', label='Min Config Limit', markersize=3, linewidth=2)
-        axes[3].fill_between(constraint_df['time_s'], constraint_df['min_config']/1000, 
-                           constraint_df['max_config']/1000,
-                           color='lightblue', alpha=0.3, label='Config Range')
-        axes[3].set_ylabel('Bandwidth (kbps)', fontsize=11)
-        axes[3].set_title('4. Configuration Limits (Min/Max Bitrate)', 
-                         fontsize=12, fontweight='bold')
-        axes[3].grid(True, alpha=0.3)
-        axes[3].legend(fontsize=10)
-
         # 5. Pushback Effect (if data available)
         if pushback_df is not None and not pushback_df.empty:
-            pushback_df['time_s'] = (pushback_df['timestamp'] - start_time_ms) / 1000.0
-            axes[4].plot(pushback_df['time_s'], pushback_df['original_rate']/1000, 'o-', 
-                        color='green', label='Before Pushback', markersize=3, linewidth=2)
-            axes[4].plot(pushback_df['time_s'], pushback_df['pushback_rate']/1000, 'o-', 
-                        color='red', label='After Pushback', markersize=3, linewidth=2)
-            axes[4].fill_between(pushback_df['time_s'], pushback_df['pushback_rate']/1000, 
-                               pushback_df['original_rate']/1000,
-                               color='red', alpha=0.3, label='Pushback Reduction')
+            pushback_time_s = pushback_df['time_s'].to_numpy()
+            original_rate = pushback_df['original_rate'].to_numpy(dtype=np.float32) * np.float32(1e-3)
+            pushback_rate = pushback_df['pushback_rate'].to_numpy(dtype=np.float32) * np.float32(1e-3)
+            rows = _plot_rows(original_rate, pushback_rate)
+            pushback_time_s, original_rate, pushback_rate = (
+                pushback_time_s[rows], original_rate[rows], pushback_rate[rows])
+            pushback_subplot = (
+                '5. Congestion Window Pushback Effect',
+                [(pushback_time_s, original_rate, 'o-', dict(color='green', label='Before Pushback', markersize=3, linewidth=2)),
+                 (pushback_time_s, pushback_rate, 'o-', dict(color='red', label='After Pushback', markersize=3, linewidth=2))],
+                (pushback_time_s, pushback_rate, original_rate,
+                 dict(color='red', alpha=0.3, label='Pushback Reduction')))
+        else:
+            # No pushback logged: the chart simply has no pushback row
+            pushback_subplot = None
+
+        # One entry per subplot: title, line series (x, y, fmt, style) and an
+        # optional fill_between (x, lower, upper, style). Constraint fills clip the
+        # lower bound so they have zero height where the limit is not binding;
+        # linewidth=0 keeps those flat stretches from drawing an edge.
+        subplots = [
+            # 1. Original LossBasedBwe Estimate
+            ('1. Original LossBasedBwe Estimate (Before Constraints)',
+             [(time_s, kbps['original'], 'o-', dict(color='green', label='LossBasedBwe Original', markersize=3, linewidth=2))],
+             None),
+            # 2. DelayBased Constraint
+            ('2. DelayBased Constraint Application (Highest Priority)',
+             [(time_s, kbps['delay_limit'], 'o-', dict(color='red', label='DelayBased Limit', markersize=3, linewidth=2)),
+              (time_s, kbps['original'], '--', dict(color='green', label='Original Estimate', alpha=0.7, linewidth=1))],
+             (time_s, np.minimum(kbps['delay_limit'], kbps['original']), kbps['original'],
+              dict(color='red', alpha=0.3, linewidth=0, label='DelayBased Constraint'))),
+            # 3. Receiver Limit Constraint
+            ('3. Receiver Limit Constraint',
+             [(time_s, kbps['receiver_limit'], 'o-', dict(color='orange', label='Receiver Limit', markersize=3, linewidth=2)),
+              (time_s, kbps['upper_limit'], '--', dict(color='purple', label='Combined Upper Limit', alpha=0.7, linewidth=1))],
+             None),
+            # 4. Config Limits (Min/Max)
+            ('4. Configuration Limits (Min/Max Bitrate)',
+             [(time_s, kbps['max_config'], 'o-', dict(color='blue', label='Max Config Limit', markersize=3, linewidth=2)),
+              (time_s, kbps['min_config'], 'o-', dict(color='cyan', label='Min Config Limit', markersize=3, linewidth=2))],
+             (time_s, kbps['min_config'], kbps['max_config'],
+              dict(color='lightblue', alpha=0.3, label='Config Range'))),
+            # 5. Pushback Effect
+            pushback_subplot,
+            # 6. Final Result Comparison
+            ('6. Final Constrained Bandwidth vs Original Estimate',
+             [(time_s, kbps['original'], '--', dict(color='green', label='Original LossBasedBwe', alpha=0.7, linewidth=2)),
+              (time_s, kbps['final'], 'o-', dict(color='purple', label='Final Constrained Rate', markersize=4, linewidth=3))],
+             (time_s, np.minimum(kbps['final'], kbps['original']), kbps['original'],
+              dict(color='orange', alpha=0.3, linewidth=0, label='Total Constraint Effect'))),
+        ]
+        subplots = [subplot for subplot in subplots if subplot is not None]
+
+        # One 4-inch row per subplot, reusing the previous figure
+        if self._constraint_fig is None:
+            self._constraint_fig = plt.figure(figsize=(16, 4 * len(subplots)))
         else:
-            axes[4].text(0.5, 0.5, 'No Congestion Window Pushback Data', 
-                        transform=axes[4].transAxes, ha='center', va='center',
-                        fontsize=14, alpha=0.5)
-        axes[4].set_ylabel('Bandwidth (kbps)', fontsize=11)
-        axes[4].set_title('5. Congestion Window Pushback Effect', 
-                         fontsize=12, fontweight='bold')
-        axes[4].grid(True, alpha=0.3)
-        axes[4].legend(fontsize=10)
-
-        # 6. Final Result Comparison
-        axes[5].plot(constraint_df['time_s'], constraint_df['original']/1000, '--', 
-                    color='green', label='Original LossBasedBwe', alpha=0.7, linewidth=2)
-        axes[5].plot(constraint_df['time_s'], constraint_df['final']/1000, 'o-', 
-                    color='purple', label='Final Constrained Rate', markersize=4, linewidth=3)
-        axes[5].fill_between(constraint_df['time_s'], constraint_df['final']/1000, 
-                           constraint_df['original']/1000,
-                           where=(constraint_df['final'] < constraint_df['original']),
-                           color='orange', alpha=0.3, label='Total Constraint Effect')
-        axes[5].set_ylabel('Bandwidth (kbps)', fontsize=11)
-        axes[5].set_title('6. Final Constrained Bandwidth vs Original Estimate', 
-                         fontsize=12, fontweight='bold')
-        axes[5].set_xlabel('Time (seconds)', fontsize=12)
-        axes[5].grid(True, alpha=0.3)
-        axes[5].legend(fontsize=10)
-
-        # Set x-axis range for all subplots
-        for ax in axes:
-            ax.set_xlim(0, time_limit)
+            self._constraint_fig.clear()
+            self._constraint_fig.set_size_inches(16, 4 * len(subplots))
+        fig = self._constraint_fig
+        axes = fig.subplots(len(subplots), 1, sharex=True)
+        fig.suptitle(f'WebRTC GCC Constraint Analysis - 5-Layer Bandwidth Limitation\n({self.log_file_path})', 
+                     fontsize=16, fontweight='bold')
+
+        for ax, (title, lines, fill) in zip(axes, subplots):
+            for x, y, fmt, style in lines:
+                ax.plot(x, y, fmt, **style)
+            if fill is not None:
+                x, lower, upper, style = fill
+                ax.fill_between(x, lower, upper, **style)
+            ax.set_ylabel('Bandwidth (kbps)', fontsize=11)
+            ax.set_title(title, fontsize=12, fontweight='bold')
+            ax.grid(True, alpha=0.3)
+            ax.legend(fontsize=10)
+        axes[-1].set_xlabel('Time (seconds)', fontsize=12)
+
+        # Set x-axis range for all subplots (sharex propagates it from the first)
+        axes[0].set_xlim(0, time_limit)
         
-        plt.tight_layout(rect=[0, 0, 1, 0.96])
-        plt.show()
+        fig.tight_layout(rect=[0, 0, 1, 0.96])
         
         return fig
 
@@ -752,24 +972,30 @@ def main():
         analyzer = GccDecisionAnalyzer(sender_log_file)
         data_dict = analyzer.parse_log_file()
         
-        # Plot original GCC decision metrics
-        fig1 = analyzer.plot_gcc_decision_metrics(data_dict)
-        
-        # Plot new constraint analysis
-        fig2 = analyzer.plot_constraint_analysis(data_dict)
-        
-        import os
         output_dir = 'analysis_results'
         os.makedirs(output_dir, exist_ok=True)
         
+        # The plot methods already ran tight_layout on the fixed-size figures, so
+        # savefig skips the extra bbox_inches='tight' pass over every artist.
+        # Each figure is saved and released (from pyplot, the analyzer cache and
+        # this frame) before the next one is drawn, so only one is alive at a time.
+        
+        # Plot original GCC decision metrics
+        fig1 = analyzer.plot_gcc_decision_metrics(data_dict)
         if fig1:
             output_path1 = os.path.join(output_dir, 'gcc_decision_analysis_vertical.png')
-            fig1.savefig(output_path1, dpi=150, bbox_inches='tight', facecolor='white')
+            fig1.savefig(output_path1, dpi=150, facecolor='white')
+            analyzer.close_figure(fig1)
+            del fig1
             print(f"[*] Original decision chart saved to: {output_path1}")
             
+        # Plot new constraint analysis
+        fig2 = analyzer.plot_constraint_analysis(data_dict)
         if fig2:
             output_path2 = os.path.join(output_dir, 'gcc_constraint_analysis.png')
-            fig2.savefig(output_path2, dpi=150, bbox_inches='tight', facecolor='white')
+            fig2.savefig(output_path2, dpi=150, facecolor='white')
+            analyzer.close_figure(fig2)
+            del fig2
             print(f"[*] Constraint analysis chart saved to: {output_path2}")
 
     except FileNotFoundError: